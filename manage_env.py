@@ -149,6 +149,24 @@ class EnvironmentManager:
             self.print_colored(f"❌ 依赖安装失败: {stderr}", Colors.FAIL)
             return False
 
+    def compile_sources(self):
+        """预编译项目源码，避免首次启动时逐个编译模块"""
+        self.print_header("预编译项目源码")
+
+        python = self.venv_python if self.venv_path.exists() else Path(sys.executable)
+
+        self.print_colored("⚙️  编译 src/ 下的Python文件...")
+        success, _, stderr = self.run_command([
+            str(python), "-m", "compileall", "-q", str(self.project_root / "src")
+        ])
+
+        if success:
+            self.print_colored("✅ 源码预编译完成", Colors.OKGREEN)
+            return True
+        else:
+            self.print_colored(f"❌ 源码预编译失败: {stderr}", Colors.FAIL)
+            return False
+
     def check_environment(self):
         """检查环境状态"""
         self.print_header("环境状态检查")
@@ -256,6 +274,9 @@ class EnvironmentManager:
         if not self.install_dependencies():
             return False
 
+        # 预编译源码（失败不影响使用）
+        self.compile_sources()
+
         # 最终检查
         self.check_environment()
 
@@ -276,9 +297,10 @@ class EnvironmentManager:
             print("4. 完整环境设置")
             print("5. 删除虚拟环境")
             print("6. 显示激活指南")
+            print("7. 预编译项目源码")
             print("0. 退出")
 
-            choice = input("\n请输入选项 (0-6): ").strip()
+            choice = input("\n请输入选项 (0-7): ").strip()
 
             if choice == "1":
                 self.create_venv()
@@ -294,6 +316,8 @@ class EnvironmentManager:
                     self.remove_venv()
             elif choice == "6":
                 self.show_activation_guide()
+            elif choice == "7":
+                self.compile_sources()
             elif choice == "0":
                 self.print_colored("👋 再见!", Colors.OKGREEN)
                 break
@@ -321,8 +345,10 @@ def main():
             manager.remove_venv()
         elif command == "guide":
             manager.show_activation_guide()
+        elif command == "compile":
+            manager.compile_sources()
         else:
-            print("用法: python manage_env.py [create|install|check|setup|remove|guide]")
+            print("用法: python manage_env.py [create|install|check|setup|remove|guide|compile]")
             print("或直接运行进入交互模式")
     else:
         manager.interactive_menu()
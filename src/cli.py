@@ -22,7 +22,7 @@ from src.core.video_processor import VideoProcessor
 from src.core.subtitle_extractor import SubtitleExtractor
 from src.core.translator import TranslationManager, TranslationProvider
 from src.core.subtitle_writer import SubtitleWriter
-from src.utils.config import get_config, setup_logging
+from src.utils.config import get_config
 from src.utils.logger import init_logger, get_logger
 from src.utils.helpers import (
     is_video_file,
@@ -667,7 +667,6 @@ def main():
     """主函数"""
     # 初始化配置和日志
     config = get_config()
-    setup_logging()
     init_logger(config.get('logging', {}))
 
     # 创建CLI实例
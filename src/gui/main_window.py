@@ -4,20 +4,17 @@
 """
 
 import os
-import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from pathlib import Path
 import threading
 import asyncio
-from typing import List, Dict, Any, Optional
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 from datetime import datetime
 
-# 添加项目根目录到Python路径
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
-from ttkthemes import ThemedTk
 from ..core.video_processor import VideoProcessor
 from ..core.subtitle_extractor import SubtitleExtractor
 from ..core.translator import TranslationManager, TranslationProvider
@@ -114,8 +111,36 @@ class ProgressDialog:
 class VideoTranslatorGUI:
     """视频翻译器主界面"""
 
+    # 视频信息显示模板
+    _INFO_TEMPLATE = """文件信息:
+文件路径: {file_path}
+文件大小: {file_size}
+格式: {format_name}
+时长: {duration}
+
+视频信息:
+分辨率: {width} x {height}
+编码: {video_codec}
+帧率: {fps:.2f} fps
+比特率: {bitrate} bps
+
+音频信息:
+编码: {audio_codec}
+音频流数量: {audio_count}
+
+字幕信息:
+字幕轨道数量: {subtitle_count}
+"""
+
     def __init__(self):
         self.config = get_config()
+
+        # 预先计算下拉框选项，避免创建界面时重复查询配置（API密钥变化后由refresh_providers更新）
+        self._compute_provider_choices()
+        self._lang_choices = tuple(
+            f"{code} - {name}" for code, name in self.config.get_supported_languages().items()
+        )
+
         self.video_processor = VideoProcessor()
         self.subtitle_extractor = SubtitleExtractor()
         self.translation_manager = TranslationManager()
@@ -123,19 +148,49 @@ class VideoTranslatorGUI:
 
         # 数据存储
         self.selected_files: List[Path] = []
+        self._selected_set: set = set()  # 与selected_files同步，用于O(1)去重
         self.current_video_info = None
         self.translation_thread = None
 
+        # 日志消息队列（由任意线程写入，主线程批量刷新）
+        self._log_queue = queue.SimpleQueue()
+
+        # 视频信息缓存，键为 (路径, 修改时间, 文件大小)
+        self._video_info_cache: Dict[Tuple[str, float, int], Any] = {}
+
+        # 视频信息加载线程池，只保留最近一次请求的结果
+        self._info_executor = ThreadPoolExecutor(max_workers=2)
+        self._pending_info_future: Optional[Future] = None
+
+        # 复用的对话框窗口（首次打开时创建）
+        self._settings_win: Optional[tk.Toplevel] = None
+        self._settings_vars: Dict[str, tk.StringVar] = {}
+        self._about_win: Optional[tk.Toplevel] = None
+
+        # 翻译工作线程的事件循环（每次翻译任务只创建一次）
+        self._worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 最新进度（由工作线程写入，主线程定时合并刷新）
+        self._latest_progress = (0.0, "")
+        self._progress_dirty = False
+
         self.setup_ui()
         self.load_settings()
 
     def setup_ui(self):
         """设置用户界面"""
-        # 创建主窗口
+        # 创建主窗口（ttkthemes仅在创建窗口时才需要）
+        from ttkthemes import ThemedTk
         self.root = ThemedTk(theme=self.config.get('ui.theme', 'arc'))
         self.root.title("视频翻译器 - Video Translator")
         self.root.geometry(self.config.get('ui.window_size', '1200x800'))
 
+        # 缓存可用主题列表，供设置对话框复用
+        try:
+            self._available_themes = tuple(sorted(self.root.get_themes()))
+        except Exception:
+            self._available_themes = ('arc', 'equilux', 'adapta')
+
         # 设置窗口图标（如果有的话）
         try:
             # self.root.iconbitmap('assets/icon.ico')
@@ -146,12 +201,19 @@ class VideoTranslatorGUI:
         # 创建主菜单
         self.create_menu()
 
+        # 创建状态栏（先于主界面布局，保证始终位于窗口底部）
+        self.create_status_bar()
+
         # 创建主界面
         self.create_main_interface()
 
         # 绑定事件
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # 启动日志和进度刷新循环
+        self._drain_log()
+        self._progress_tick()
+
     def create_menu(self):
         """创建菜单栏"""
         menubar = tk.Menu(self.root)
@@ -177,6 +239,25 @@ class VideoTranslatorGUI:
         menubar.add_cascade(label="帮助", menu=help_menu)
         help_menu.add_command(label="关于", command=self.show_about)
 
+    def create_status_bar(self):
+        """创建底部状态栏"""
+        self.status_label = ttk.Label(self.root, text="", anchor="w")
+        self.status_label.pack(side="bottom", fill="x", padx=10, pady=(0, 5))
+        self._status_after_id = None
+
+    def show_status(self, message: str, duration: int = 3000):
+        """在状态栏显示非阻塞提示，duration毫秒后自动清除"""
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+
+        self.status_label.config(text=message)
+        self._status_after_id = self.root.after(duration, self._clear_status)
+
+    def _clear_status(self):
+        """清除状态栏提示"""
+        self._status_after_id = None
+        self.status_label.config(text="")
+
     def create_main_interface(self):
         """创建主界面"""
         # 创建主框架
@@ -249,12 +330,10 @@ class VideoTranslatorGUI:
 
         # 创建Treeview
         columns = ("文件名", "格式", "大小", "状态")
-        self.file_tree = ttk.Treeview(list_frame, columns=columns, show="tree headings", height=8)
+        # 完整路径保存在条目的iid中，不再单独显示路径列
+        self.file_tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=8)
 
         # 设置列
-        self.file_tree.heading("#0", text="路径")
-        self.file_tree.column("#0", width=200)
-
         for col in columns:
             self.file_tree.heading(col, text=col)
             self.file_tree.column(col, width=80)
@@ -283,15 +362,10 @@ class VideoTranslatorGUI:
         ttk.Label(row1, text="AI提供商:").pack(side="left")
         self.provider_var = tk.StringVar(value=self.config.get('translation.provider', 'openai'))
         provider_combo = ttk.Combobox(row1, textvariable=self.provider_var, state="readonly", width=15)
-
-        # 获取有效的翻译提供商
-        available_providers = self.config.get_available_providers()
+        self.provider_combo = provider_combo
 
         # 如果没有有效的提供商，提示用户
-        if not available_providers:
-            available_providers = ['请先配置API密钥']
-
-        provider_combo['values'] = available_providers
+        provider_combo['values'] = self._provider_choices or ('请先配置API密钥',)
         provider_combo.pack(side="left", padx=(5, 10))
 
         ttk.Label(row1, text="模型:").pack(side="left")
@@ -308,8 +382,7 @@ class VideoTranslatorGUI:
         lang_combo = ttk.Combobox(row2, textvariable=self.target_lang_var, state="readonly", width=15)
 
         # 设置语言选项
-        languages = self.config.get_supported_languages()
-        lang_combo['values'] = [f"{code} - {name}" for code, name in languages.items()]
+        lang_combo['values'] = self._lang_choices
         lang_combo.pack(side="left", padx=(5, 10))
 
         ttk.Label(row2, text="输出格式:").pack(side="left")
@@ -424,22 +497,20 @@ class VideoTranslatorGUI:
     def setup_log_handler(self):
         """设置日志处理器"""
         class GUILogHandler(logging.Handler):
-            def __init__(self, text_widget):
+            """只负责格式化并入队，不直接操作Tk控件（可在任意线程调用）"""
+
+            def __init__(self, log_queue):
                 super().__init__()
-                self.text_widget = text_widget
+                self.log_queue = log_queue
 
             def emit(self, record):
                 try:
-                    msg = self.format(record)
-                    self.text_widget.config(state="normal")
-                    self.text_widget.insert(tk.END, msg + "\n")
-                    self.text_widget.see(tk.END)
-                    self.text_widget.config(state="disabled")
-                except:
-                    pass
+                    self.log_queue.put_nowait(self.format(record))
+                except Exception:
+                    self.handleError(record)
 
         # 添加GUI日志处理器
-        gui_handler = GUILogHandler(self.log_text)
+        gui_handler = GUILogHandler(self._log_queue)
         gui_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%H:%M:%S'
@@ -448,15 +519,54 @@ class VideoTranslatorGUI:
         root_logger = logging.getLogger()
         root_logger.addHandler(gui_handler)
 
+    def _drain_log(self, max_records: int = 200):
+        """在主线程中批量刷新日志队列到日志控件"""
+        batch = []
+        try:
+            while len(batch) < max_records:
+                batch.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if batch:
+            try:
+                self.log_text.config(state="normal")
+                self.log_text.insert(tk.END, "\n".join(batch) + "\n")
+                self.log_text.see(tk.END)
+                self.log_text.config(state="disabled")
+            except tk.TclError:
+                pass
+
+        self.root.after(100, self._drain_log)
+
     def load_settings(self):
         """加载设置"""
         # 更新模型选择
         self.on_provider_change()
 
+    def _compute_provider_choices(self):
+        """计算提供商信息和可用提供商列表"""
+        self._providers_info = self.config.get_translation_providers()
+        self._provider_choices = tuple(
+            provider for provider, info in self._providers_info.items()
+            if info.get('available', False)
+        )
+
+    def refresh_providers(self):
+        """重新读取API密钥并更新提供商下拉框（API密钥或配置修改后调用）"""
+        self.config.reload_api_keys()
+        self._compute_provider_choices()
+
+        self.provider_combo['values'] = self._provider_choices or ('请先配置API密钥',)
+        if self._provider_choices and self.provider_var.get() not in self._provider_choices:
+            self.provider_var.set(self._provider_choices[0])
+
+        self.on_provider_change()
+
     def on_provider_change(self, event=None):
         """提供商变化事件"""
         provider = self.provider_var.get()
-        providers_info = self.config.get_translation_providers()
+        providers_info = self._providers_info
 
         if provider in providers_info:
             models = providers_info[provider].get('models', [])
@@ -504,8 +614,8 @@ class VideoTranslatorGUI:
             # 添加文件到列表
             for file_path in files:
                 path = Path(file_path)
-                if is_video_file(path) and path not in self.selected_files:
-                    self.selected_files.append(path)
+                if path not in self._selected_set and is_video_file(path):
+                    self._add_selected_file(path)
 
             self.update_file_list()
             self.update_button_states()
@@ -533,8 +643,8 @@ class VideoTranslatorGUI:
             # 添加文件到列表
             for file_path in files:
                 path = Path(file_path)
-                if path.suffix.lower() in ['.srt', '.vtt', '.ass', '.ssa', '.sub'] and path not in self.selected_files:
-                    self.selected_files.append(path)
+                if path not in self._selected_set and path.suffix.lower() in ['.srt', '.vtt', '.ass', '.ssa', '.sub']:
+                    self._add_selected_file(path)
 
             self.update_file_list()
             self.update_button_states()
@@ -569,24 +679,27 @@ class VideoTranslatorGUI:
         if directory:
             self.config.update_last_used_dir(directory)
 
-            # 获取目录中的视频文件
+            # 获取目录中的视频文件（递归扫描，每次重新扫描以反映子目录中的变化）
             video_files = get_video_files_in_directory(directory, recursive=True)
 
             for file_path in video_files:
-                if file_path not in self.selected_files:
-                    self.selected_files.append(file_path)
+                if file_path not in self._selected_set:
+                    self._add_selected_file(file_path)
 
             self.update_file_list()
             self.update_button_states()
 
-            messagebox.showinfo(
-                "信息",
-                f"找到 {len(video_files)} 个视频文件"
-            )
+            self.show_status(f"找到 {len(video_files)} 个视频文件")
+
+    def _add_selected_file(self, path: Path):
+        """添加文件到已选列表（调用方需先检查是否已存在）"""
+        self.selected_files.append(path)
+        self._selected_set.add(path)
 
     def clear_file_list(self):
         """清除文件列表"""
         self.selected_files.clear()
+        self._selected_set.clear()
         self.update_file_list()
         self.update_button_states()
         self.clear_video_info()
@@ -649,8 +762,7 @@ class VideoTranslatorGUI:
     def update_file_list(self):
         """更新文件列表"""
         # 清空列表
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        self.file_tree.delete(*self.file_tree.get_children())
 
         # 清除上次的视频信息
         self.current_video_info = None
@@ -661,7 +773,7 @@ class VideoTranslatorGUI:
 
             self.file_tree.insert(
                 "", "end",
-                text=str(file_path),
+                iid=str(file_path),
                 values=(
                     file_path.name,
                     file_path.suffix.upper()[1:],
@@ -674,30 +786,57 @@ class VideoTranslatorGUI:
         """文件选择事件"""
         selection = self.file_tree.selection()
         if selection:
-            item = selection[0]
-            file_path = Path(self.file_tree.item(item, "text"))
+            file_path = Path(selection[0])
             self.load_video_info(file_path)
 
     def load_video_info(self, file_path: Path):
         """加载视频信息"""
-        def load_info():
-            try:
-                video_info = self.video_processor.get_video_info(file_path)
-                self.current_video_info = video_info
-
-                # 在主线程更新UI
-                self.root.after(0, lambda: self.display_video_info(video_info))
-
-            except Exception as e:
-                error_msg = f"加载视频信息失败: {e}"
-                self.root.after(0, lambda: self.display_error(error_msg))
+        # 取消尚未开始的旧请求
+        if self._pending_info_future is not None:
+            self._pending_info_future.cancel()
 
         # 在后台线程加载
-        threading.Thread(target=load_info, daemon=True).start()
+        future = self._info_executor.submit(self._get_video_info_cached, file_path)
+        self._pending_info_future = future
+        future.add_done_callback(self._on_video_info_loaded)
 
         # 显示加载中状态
         self.display_loading_info()
 
+    def _on_video_info_loaded(self, future: Future):
+        """视频信息加载完成回调（在工作线程中调用）"""
+        if future.cancelled():
+            return
+
+        # 在主线程更新UI
+        self.root.after(0, lambda: self._show_loaded_video_info(future))
+
+    def _show_loaded_video_info(self, future: Future):
+        """在主线程显示加载结果，忽略已过期的请求"""
+        if future is not self._pending_info_future:
+            return
+
+        try:
+            video_info = future.result()
+        except Exception as e:
+            self.display_error(f"加载视频信息失败: {e}")
+            return
+
+        self.current_video_info = video_info
+        self.display_video_info(video_info)
+
+    def _get_video_info_cached(self, file_path: Path):
+        """获取视频信息，文件未变化时复用上次ffprobe的结果"""
+        st = file_path.stat()
+        key = (str(file_path), st.st_mtime, st.st_size)
+
+        video_info = self._video_info_cache.get(key)
+        if video_info is None:
+            video_info = self.video_processor.get_video_info(file_path)
+            self._video_info_cache[key] = video_info
+
+        return video_info
+
     def display_loading_info(self):
         """显示加载中信息"""
         self.info_text.config(state="normal")
@@ -710,35 +849,31 @@ class VideoTranslatorGUI:
         self.info_text.config(state="normal")
         self.info_text.delete(1.0, tk.END)
 
-        info_text = f"""文件信息:
-文件路径: {video_info.file_path}
-文件大小: {format_file_size(video_info.file_size)}
-格式: {video_info.format_name}
-时长: {format_duration(video_info.duration)}
-
-视频信息:
-分辨率: {video_info.width} x {video_info.height}
-编码: {video_info.video_codec}
-帧率: {video_info.fps:.2f} fps
-比特率: {video_info.bitrate} bps
-
-音频信息:
-编码: {video_info.audio_codec}
-音频流数量: {len(video_info.audio_streams)}
-
-字幕信息:
-字幕轨道数量: {len(video_info.subtitle_streams)}
-"""
+        info_text = self._INFO_TEMPLATE.format_map({
+            'file_path': video_info.file_path,
+            'file_size': format_file_size(video_info.file_size),
+            'format_name': video_info.format_name,
+            'duration': format_duration(video_info.duration),
+            'width': video_info.width,
+            'height': video_info.height,
+            'video_codec': video_info.video_codec,
+            'fps': video_info.fps,
+            'bitrate': video_info.bitrate,
+            'audio_codec': video_info.audio_codec,
+            'audio_count': len(video_info.audio_streams),
+            'subtitle_count': len(video_info.subtitle_streams),
+        })
 
         if video_info.subtitle_streams:
-            info_text += "\n字幕轨道详情:\n"
+            parts = [info_text, "字幕轨道详情:"]
             # 构建字幕轨道选择列表
             track_options = []
             for i, subtitle in enumerate(video_info.subtitle_streams):
-                info_text += f"  轨道 {i+1}: {subtitle.title} ({subtitle.language}, {subtitle.codec})\n"
+                parts.append(f"  轨道 {i+1}: {subtitle.title} ({subtitle.language}, {subtitle.codec})")
                 # 为下拉框准备选项
                 track_display = f"轨道 {subtitle.index}: {subtitle.title} ({subtitle.language}, {subtitle.codec})"
                 track_options.append(track_display)
+            info_text = "\n".join(parts) + "\n"
 
             # 更新字幕轨道选择下拉框
             self.subtitle_track_combo['values'] = track_options
@@ -792,20 +927,12 @@ class VideoTranslatorGUI:
             messagebox.showwarning("警告", f"'{provider_str}' 提供商的API密钥无效或未配置，请检查api_keys.yaml文件")
             return
 
-        # 获取设置
-        provider_str = self.provider_var.get()
+        # 获取设置（在主线程中一次性读取，工作线程不再访问Tk变量）
         target_lang = self.target_lang_var.get().split(' - ')[0]  # 提取语言代码
         output_format = self.output_format_var.get()
         bilingual = self.bilingual_var.get()
         extract_all = self.extract_all_var.get()
-
-        # 验证API密钥
-        if not self.config.validate_api_config(provider_str):
-            messagebox.showerror(
-                "错误",
-                f"请检查 {provider_str} 的API配置"
-            )
-            return
+        selected_track_index = None if extract_all else self._get_selected_subtitle_track_index(self.current_video_info)
 
         # 更新UI状态
         self.start_button.config(state="disabled")
@@ -815,14 +942,19 @@ class VideoTranslatorGUI:
         # 启动翻译线程
         self.translation_thread = threading.Thread(
             target=self.translation_worker,
-            args=(provider_str, target_lang, output_format, bilingual, extract_all),
+            args=(provider_str, target_lang, output_format, bilingual, extract_all, selected_track_index),
             daemon=True
         )
         self.translation_thread.start()
 
     def translation_worker(self, provider_str: str, target_lang: str,
-                          output_format: str, bilingual: bool, extract_all: bool):
+                          output_format: str, bilingual: bool, extract_all: bool,
+                          selected_track_index: Optional[int] = None):
         """翻译工作线程"""
+        # 整个翻译任务共用一个事件循环
+        self._worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._worker_loop)
+
         try:
             # 重置停止标志
             self._stop_translation = False
@@ -831,35 +963,65 @@ class VideoTranslatorGUI:
             completed = True
             processed_files = []
 
-            for i, file_path in enumerate(self.selected_files):
-                if hasattr(self, '_stop_translation') and self._stop_translation:
-                    logger.info("翻译被用户停止")
-                    completed = False
-                    break
+            files = list(self.selected_files)
+            subtitle_exts = ['.srt', '.vtt', '.ass', '.ssa', '.sub']
 
-                # 更新进度
-                progress = (i / total_files) * 100
-                self.root.after(0, lambda p=progress: self.update_progress(p, f"处理文件 {i+1}/{total_files}: {file_path.name}"))
+            # 循环中频繁使用的方法绑定到局部变量
+            post_progress = self._post_progress
+            process_subtitle_file = self.process_subtitle_file
+            process_single_file = self.process_single_file
+            extract_video_subtitles = self._extract_video_subtitles
 
-                # 处理单个文件
-                try:
-                    # 判断是字幕文件还是视频文件
-                    if file_path.suffix.lower() in ['.srt', '.vtt', '.ass', '.ssa', '.sub']:
-                        # 直接翻译字幕文件
-                        output_path = self.process_subtitle_file(file_path, provider_str, target_lang, output_format, bilingual)
-                        if output_path and output_path.exists():
-                            processed_files.append(output_path)
-                    else:
-                        # 处理视频文件
-                        output_paths = self.process_single_file(file_path, provider_str, target_lang, output_format, bilingual, extract_all)
-                        if output_paths:
-                            processed_files.extend(output_paths)
-                except Exception as e:
-                    logger.error(f"处理文件 {file_path.name} 时出错: {e}")
+            # 在后台预先提取下一个视频文件的字幕，使其与当前文件的翻译重叠进行
+            prefetched: Dict[int, Future] = {}
+            with ThreadPoolExecutor(max_workers=1) as extract_executor:
+                for i, file_path in enumerate(files):
                     if hasattr(self, '_stop_translation') and self._stop_translation:
+                        logger.info("翻译被用户停止")
                         completed = False
                         break
 
+                    # 更新进度
+                    progress = (i / total_files) * 100
+                    post_progress(progress, f"处理文件 {i+1}/{total_files}: {file_path.name}")
+
+                    next_index = i + 1
+                    if next_index < total_files and files[next_index].suffix.lower() not in subtitle_exts:
+                        prefetched[next_index] = extract_executor.submit(
+                            extract_video_subtitles, files[next_index], extract_all, selected_track_index
+                        )
+
+                    # 处理单个文件
+                    try:
+                        # 判断是字幕文件还是视频文件
+                        if file_path.suffix.lower() in subtitle_exts:
+                            # 直接翻译字幕文件
+                            output_path = process_subtitle_file(file_path, provider_str, target_lang, output_format, bilingual)
+                            if output_path and output_path.exists():
+                                processed_files.append(output_path)
+                        else:
+                            # 处理视频文件（优先使用后台预取的字幕）
+                            future = prefetched.pop(i, None)
+                            if future is not None:
+                                extracted_subtitles = future.result()
+                            else:
+                                extracted_subtitles = extract_video_subtitles(file_path, extract_all, selected_track_index)
+                            output_paths = process_single_file(
+                                file_path, provider_str, target_lang, output_format, bilingual,
+                                extract_all, extracted_subtitles=extracted_subtitles
+                            )
+                            if output_paths:
+                                processed_files.extend(output_paths)
+                    except Exception as e:
+                        logger.error(f"处理文件 {file_path.name} 时出错: {e}")
+                        if hasattr(self, '_stop_translation') and self._stop_translation:
+                            completed = False
+                            break
+
+                # 取消尚未开始的预取任务
+                for future in prefetched.values():
+                    future.cancel()
+
             # 完成或取消
             if completed:
                 self.root.after(0, lambda processed=processed_files: self.translation_completed(processed))
@@ -871,12 +1033,16 @@ class VideoTranslatorGUI:
             logger.error(error_msg)
             self.root.after(0, lambda: self.translation_error(error_msg))
 
+        finally:
+            self._worker_loop.close()
+            self._worker_loop = None
+
     def process_subtitle_file(self, subtitle_path: Path, provider_str: str, target_lang: str,
                              output_format: str, bilingual: bool):
         """处理字幕文件"""
         try:
             logger.info(f"开始处理字幕文件: {subtitle_path.name}")
-            self.update_progress(0, f"处理字幕文件: {subtitle_path.name}")
+            self._post_progress(0, f"处理字幕文件: {subtitle_path.name}")
 
             # 检查文件是否存在
             if not subtitle_path.exists():
@@ -899,7 +1065,7 @@ class VideoTranslatorGUI:
                         f"字符数: {stats['character_count']}，单词数: {stats['word_count']}")
 
             # 更新进度详情
-            self.update_progress(0, f"字幕文件: {subtitle_path.name}，{len(subtitle_file.segments)}个片段，{format_duration(stats['duration'])}")
+            self._post_progress(0, f"字幕文件: {subtitle_path.name}，{len(subtitle_file.segments)}个片段，{format_duration(stats['duration'])}")
 
             # 生成输出路径
             output_base = subtitle_path.parent / f"{subtitle_path.stem}_{target_lang}"
@@ -921,56 +1087,37 @@ class VideoTranslatorGUI:
             raise
 
     def process_single_file(self, file_path: Path, provider_str: str, target_lang: str,
-                           output_format: str, bilingual: bool, extract_all: bool):
+                           output_format: str, bilingual: bool, extract_all: bool,
+                           extracted_subtitles: Optional[Dict[int, Path]] = None):
         """处理单个视频文件"""
         try:
             logger.info(f"开始处理视频文件: {file_path.name}")
             output_paths = []
 
-            # 获取视频信息
-            video_info = self.video_processor.get_video_info(file_path)
+            # 提取字幕（如已在后台预取则直接使用）
+            if extracted_subtitles is None:
+                selected_track_index = None if extract_all else self._get_selected_subtitle_track_index(None)
+                extracted_subtitles = self._extract_video_subtitles(file_path, extract_all, selected_track_index)
 
-            if not video_info.subtitle_streams:
-                logger.warning(f"文件 {file_path.name} 没有字幕轨道")
+            if not extracted_subtitles:
                 return output_paths
 
-            # 提取字幕
-            if extract_all:
-                # 提取所有字幕轨道
-                extracted_subtitles = self.video_processor.extract_all_subtitles(
-                    file_path, output_format='srt'
-                )
-                logger.info(f"提取了 {len(extracted_subtitles)} 个字幕轨道")
-            else:
-                # 提取选定的字幕轨道
-                selected_track_index = self._get_selected_subtitle_track_index(video_info)
-                if selected_track_index is not None:
-                    logger.info(f"提取选定的字幕轨道: {selected_track_index}")
-                    subtitle_path = self.video_processor.extract_subtitle(
-                        file_path, subtitle_index=selected_track_index
-                    )
-                    extracted_subtitles = {selected_track_index: subtitle_path} if subtitle_path else {}
-                else:
-                    # 如果没有选择或选择无效，使用第一个轨道
-                    logger.info(f"使用第一个字幕轨道: {video_info.subtitle_streams[0].index}")
-                    subtitle_path = self.video_processor.extract_subtitle(
-                        file_path, subtitle_index=video_info.subtitle_streams[0].index
-                    )
-                    extracted_subtitles = {0: subtitle_path} if subtitle_path else {}
+            post_progress = self._post_progress
+            translate_subtitle_file = self.translate_subtitle_file
 
             # 更新进度详情
             track_count = len(extracted_subtitles)
-            self.update_progress(0, f"从视频中提取了 {track_count} 个字幕轨道")
+            post_progress(0, f"从视频中提取了 {track_count} 个字幕轨道")
 
             # 翻译每个字幕文件
             for i, (subtitle_index, subtitle_path) in enumerate(extracted_subtitles.items()):
                 if subtitle_path and subtitle_path.exists():
                     # 更新进度
                     track_progress = (i / track_count) * 100
-                    self.update_progress(track_progress, f"翻译字幕轨道 {i+1}/{track_count}: {subtitle_path.name}")
+                    post_progress(track_progress, f"翻译字幕轨道 {i+1}/{track_count}: {subtitle_path.name}")
 
                     # 翻译字幕
-                    output_path = self.translate_subtitle_file(
+                    output_path = translate_subtitle_file(
                         subtitle_path, file_path, provider_str, target_lang,
                         output_format, bilingual
                     )
@@ -984,6 +1131,41 @@ class VideoTranslatorGUI:
             logger.error(f"处理文件 {file_path.name} 失败: {e}")
             raise
 
+    def _extract_video_subtitles(self, file_path: Path, extract_all: bool,
+                                 selected_track_index: Optional[int] = None) -> Dict[int, Path]:
+        """从视频文件中提取字幕，返回 {轨道索引: 字幕文件路径}"""
+        video_processor = self.video_processor
+
+        # 获取视频信息
+        video_info = self._get_video_info_cached(file_path)
+
+        if not video_info.subtitle_streams:
+            logger.warning(f"文件 {file_path.name} 没有字幕轨道")
+            return {}
+
+        if extract_all:
+            # 提取所有字幕轨道
+            extracted_subtitles = video_processor.extract_all_subtitles(
+                file_path, output_format='srt'
+            )
+            logger.info(f"提取了 {len(extracted_subtitles)} 个字幕轨道")
+            return extracted_subtitles
+
+        # 提取选定的字幕轨道
+        if selected_track_index is not None:
+            logger.info(f"提取选定的字幕轨道: {selected_track_index}")
+            subtitle_path = video_processor.extract_subtitle(
+                file_path, subtitle_index=selected_track_index
+            )
+            return {selected_track_index: subtitle_path} if subtitle_path else {}
+
+        # 如果没有选择或选择无效，使用第一个轨道
+        logger.info(f"使用第一个字幕轨道: {video_info.subtitle_streams[0].index}")
+        subtitle_path = video_processor.extract_subtitle(
+            file_path, subtitle_index=video_info.subtitle_streams[0].index
+        )
+        return {0: subtitle_path} if subtitle_path else {}
+
     def _get_selected_subtitle_track_index(self, video_info) -> Optional[int]:
         """获取选定的字幕轨道索引"""
         selected_track = self.subtitle_track_var.get()
@@ -1012,54 +1194,48 @@ class VideoTranslatorGUI:
 
             # 获取字幕统计信息用于显示
             stats = self.subtitle_extractor.get_subtitle_statistics(subtitle_file)
-            self.update_progress(0, f"正在翻译 {len(subtitle_file.segments)} 个片段，共 {format_duration(stats['duration'])} 时长")
-
-            # 创建异步事件循环
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            self._post_progress(0, f"正在翻译 {len(subtitle_file.segments)} 个片段，共 {format_duration(stats['duration'])} 时长")
 
+            # 执行翻译（复用工作线程的事件循环）
+            provider = TranslationProvider(provider_str)
+            coro = self.translation_manager.translate_subtitle_file(
+                subtitle_file,
+                target_lang,
+                provider,
+                progress_callback=self.translation_progress_callback,
+                cancellation_check=lambda: hasattr(self, '_stop_translation') and self._stop_translation
+            )
             try:
-                # 执行翻译
-                provider = TranslationProvider(provider_str)
-                try:
-                    translated_file = loop.run_until_complete(
-                        self.translation_manager.translate_subtitle_file(
-                            subtitle_file,
-                            target_lang,
-                            provider,
-                            progress_callback=self.translation_progress_callback,
-                            cancellation_check=lambda: hasattr(self, '_stop_translation') and self._stop_translation
-                        )
-                    )
-                except asyncio.CancelledError:
-                    logger.info("翻译过程被取消")
-                    return None
-
-                # 如果翻译被取消，直接返回
-                if not translated_file:
-                    logger.info("翻译被取消，跳过保存")
-                    return None
-
-                # 保存翻译结果
-                output_filename = self.subtitle_writer.get_output_filename(
-                    video_path.name, target_lang, output_format, bilingual
-                )
-                output_path = video_path.parent / output_filename
-
-                self.subtitle_writer.write_subtitle_file(
-                    translated_file,
-                    output_path,
-                    output_format,
-                    bilingual
-                )
+                if self._worker_loop is not None:
+                    translated_file = self._worker_loop.run_until_complete(coro)
+                else:
+                    translated_file = asyncio.run(coro)
+            except asyncio.CancelledError:
+                logger.info("翻译过程被取消")
+                return None
+
+            # 如果翻译被取消，直接返回
+            if not translated_file:
+                logger.info("翻译被取消，跳过保存")
+                return None
+
+            # 保存翻译结果
+            output_filename = self.subtitle_writer.get_output_filename(
+                video_path.name, target_lang, output_format, bilingual
+            )
+            output_path = video_path.parent / output_filename
 
-                logger.info(f"翻译完成: {output_path}")
-                self.update_progress(100, f"翻译完成: {output_path.name}")
+            self.subtitle_writer.write_subtitle_file(
+                translated_file,
+                output_path,
+                output_format,
+                bilingual
+            )
 
-                return output_path
+            logger.info(f"翻译完成: {output_path}")
+            self._post_progress(100, f"翻译完成: {output_path.name}")
 
-            finally:
-                loop.close()
+            return output_path
 
         except Exception as e:
             logger.error(f"翻译字幕文件失败: {e}")
@@ -1067,8 +1243,21 @@ class VideoTranslatorGUI:
 
     def translation_progress_callback(self, current: int, total: int, progress: float):
         """翻译进度回调"""
-        detail = f"翻译进度: {current}/{total} ({progress:.1f}%)"
-        self.root.after(0, lambda: self.update_progress(progress, detail))
+        self._post_progress(progress, f"翻译进度: {current}/{total} ({progress:.1f}%)")
+
+    def _post_progress(self, progress: float, detail: str = ""):
+        """记录最新进度（可在工作线程调用），由主线程定时合并刷新"""
+        self._latest_progress = (progress, detail)
+        self._progress_dirty = True
+
+    def _progress_tick(self):
+        """以约20Hz的频率将最新进度刷新到界面"""
+        if self._progress_dirty:
+            self._progress_dirty = False
+            progress, detail = self._latest_progress
+            self.update_progress(progress, detail)
+
+        self.root.after(50, self._progress_tick)
 
     def stop_translation(self):
         """停止翻译"""
@@ -1086,6 +1275,7 @@ class VideoTranslatorGUI:
 
     def translation_cancelled(self, processed_files=None):
         """翻译被取消"""
+        self._progress_dirty = False
         self.stop_button.config(state="disabled")
         self.progress_label.config(text="已取消")
         self.progress_detail.set("翻译已被用户取消")
@@ -1103,9 +1293,11 @@ class VideoTranslatorGUI:
 
     def translation_completed(self, processed_files=None):
         """翻译完成"""
+        self._progress_dirty = False
         self.stop_button.config(state="disabled")
         self.progress_var.set(100)
         self.progress_label.config(text="翻译完成")
+        self.show_status("翻译完成")
 
         if processed_files and len(processed_files) > 0:
             # 生成输出文件列表消息
@@ -1122,6 +1314,7 @@ class VideoTranslatorGUI:
 
     def translation_error(self, error_msg: str):
         """翻译错误"""
+        self._progress_dirty = False
         self.stop_button.config(state="disabled")
         self.progress_label.config(text="发生错误")
 
@@ -1138,18 +1331,40 @@ class VideoTranslatorGUI:
 
     def show_settings(self):
         """显示设置对话框"""
-        # 创建设置窗口
-        settings_window = tk.Toplevel(self.root)
-        settings_window.title("设置")
-        settings_window.geometry("500x400")
-        settings_window.transient(self.root)
-        settings_window.grab_set()
+        # 对话框只创建一次，之后复用隐藏的窗口
+        if self._settings_win is None:
+            self._build_settings_window()
+        else:
+            # 刷新为当前配置
+            self._settings_vars['output_dir'].set(self.config.get('output.default_dir', './output'))
+            self._settings_vars['template'].set(self.config.get('output.filename_template', '{original_name}_{lang}_{format}'))
+            self._settings_vars['theme'].set(self.config.get('ui.theme', 'arc'))
+            self._settings_vars['language'].set(self.config.get('ui.language', 'zh_CN'))
+
+        settings_window = self._settings_win
 
         # 居中显示
         settings_window.geometry("+%d+%d" % (
             self.root.winfo_rootx() + 100,
             self.root.winfo_rooty() + 100
         ))
+        settings_window.deiconify()
+        settings_window.grab_set()
+
+    def _hide_settings(self):
+        """隐藏设置对话框"""
+        self._settings_win.grab_release()
+        self._settings_win.withdraw()
+
+    def _build_settings_window(self):
+        """创建设置对话框"""
+        settings_window = tk.Toplevel(self.root)
+        settings_window.withdraw()
+        settings_window.title("设置")
+        settings_window.geometry("500x400")
+        settings_window.transient(self.root)
+        settings_window.protocol("WM_DELETE_WINDOW", self._hide_settings)
+        self._settings_win = settings_window
 
         notebook = ttk.Notebook(settings_window)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
@@ -1190,23 +1405,25 @@ class VideoTranslatorGUI:
         theme_var = tk.StringVar(value=self.config.get('ui.theme', 'arc'))
         theme_combo = ttk.Combobox(theme_frame, textvariable=theme_var, state="readonly")
 
-        # 获取可用主题
-        try:
-            from ttkthemes import themed_tk
-            available_themes = themed_tk.ThemedTk().get_themes()
-            theme_combo['values'] = sorted(available_themes)
-        except:
-            theme_combo['values'] = ['arc', 'equilux', 'adapta']
+        # 可用主题
+        theme_combo['values'] = self._available_themes
 
         theme_combo.pack(fill="x", pady=5)
 
         # 语言设置
         ttk.Label(theme_frame, text="界面语言:").pack(anchor="w", pady=(10, 0))
         lang_var = tk.StringVar(value=self.config.get('ui.language', 'zh_CN'))
-        lang_combo = ttk.Combobox(lang_var, textvariable=lang_var, state="readonly")
+        lang_combo = ttk.Combobox(theme_frame, textvariable=lang_var, state="readonly")
         lang_combo['values'] = ['zh_CN', 'en_US']
         lang_combo.pack(fill="x", pady=5)
 
+        self._settings_vars = {
+            'output_dir': output_dir_var,
+            'template': template_var,
+            'theme': theme_var,
+            'language': lang_var,
+        }
+
         # 按钮区域
         button_frame = ttk.Frame(settings_window)
         button_frame.pack(fill="x", padx=10, pady=10)
@@ -1217,20 +1434,22 @@ class VideoTranslatorGUI:
             self.config.set('output.filename_template', template_var.get())
             self.config.set('ui.theme', theme_var.get())
             self.config.set('ui.language', lang_var.get())
+            self.refresh_providers()
 
             messagebox.showinfo("设置", "设置已保存，重启应用后生效")
-            settings_window.destroy()
+            self._hide_settings()
 
         def reset_settings():
             """重置设置"""
             if messagebox.askyesno("确认", "确定要重置所有设置吗？"):
                 self.config.reset_to_defaults()
+                self.refresh_providers()
                 messagebox.showinfo("设置", "设置已重置")
-                settings_window.destroy()
+                self._hide_settings()
 
         ttk.Button(button_frame, text="保存", command=save_settings).pack(side="right", padx=(5, 0))
         ttk.Button(button_frame, text="重置", command=reset_settings).pack(side="right")
-        ttk.Button(button_frame, text="取消", command=settings_window.destroy).pack(side="right", padx=(0, 5))
+        ttk.Button(button_frame, text="取消", command=self._hide_settings).pack(side="right", padx=(0, 5))
 
     def clear_logs(self):
         """清除日志"""
@@ -1241,18 +1460,35 @@ class VideoTranslatorGUI:
 
     def show_about(self):
         """显示关于对话框"""
-        about_window = tk.Toplevel(self.root)
-        about_window.title("关于")
-        about_window.geometry("400x300")
-        about_window.resizable(False, False)
-        about_window.transient(self.root)
-        about_window.grab_set()
+        # 对话框只创建一次，之后复用隐藏的窗口
+        if self._about_win is None:
+            self._build_about_window()
+
+        about_window = self._about_win
 
         # 居中显示
         about_window.geometry("+%d+%d" % (
             self.root.winfo_rootx() + 150,
             self.root.winfo_rooty() + 150
         ))
+        about_window.deiconify()
+        about_window.grab_set()
+
+    def _hide_about(self):
+        """隐藏关于对话框"""
+        self._about_win.grab_release()
+        self._about_win.withdraw()
+
+    def _build_about_window(self):
+        """创建关于对话框"""
+        about_window = tk.Toplevel(self.root)
+        about_window.withdraw()
+        about_window.title("关于")
+        about_window.geometry("400x300")
+        about_window.resizable(False, False)
+        about_window.transient(self.root)
+        about_window.protocol("WM_DELETE_WINDOW", self._hide_about)
+        self._about_win = about_window
 
         main_frame = ttk.Frame(about_window, padding="20")
         main_frame.pack(fill="both", expand=True)
@@ -1296,7 +1532,7 @@ CPU核心数: {system_info.get('cpu_count', 'Unknown')}
         sys_label = ttk.Label(main_frame, text=sys_text, justify="left", font=("Arial", 8))
         sys_label.pack(pady=(0, 20))
 
-        ttk.Button(main_frame, text="确定", command=about_window.destroy).pack()
+        ttk.Button(main_frame, text="确定", command=self._hide_about).pack()
 
     def on_closing(self):
         """关闭应用"""
@@ -1304,15 +1540,24 @@ CPU核心数: {system_info.get('cpu_count', 'Unknown')}
         if self.translation_thread and self.translation_thread.is_alive():
             if messagebox.askyesno("确认", "翻译正在进行中，确定要退出吗？"):
                 self._stop_translation = True
+                self._shutdown_info_executor()
                 self.root.quit()
         else:
+            self._shutdown_info_executor()
             self.root.quit()
 
+    def _shutdown_info_executor(self):
+        """取消未完成的视频信息请求并关闭线程池"""
+        if self._pending_info_future is not None:
+            self._pending_info_future.cancel()
+        self._info_executor.shutdown(wait=False)
+
     def clear_file_list(self):
         """清空文件列表"""
         if self.selected_files:
             if messagebox.askyesno("确认", "确定要清空所有已选择的文件吗？"):
                 self.selected_files.clear()
+                self._selected_set.clear()
                 self.update_file_list()
                 self.clear_video_info()
 
@@ -1321,7 +1566,7 @@ CPU核心数: {system_info.get('cpu_count', 'Unknown')}
         # 检查是否有选择的文件
         if self.selected_files and len(self.selected_files) > 0:
             # 检查是否有可用的翻译提供商
-            available_providers = self.config.get_available_providers()
+            available_providers = self._provider_choices
             if available_providers and self.provider_var.get() in available_providers:
                 # 检查翻译线程是否在运行
                 if hasattr(self, 'translation_thread') and self.translation_thread and self.translation_thread.is_alive():
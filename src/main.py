@@ -6,25 +6,87 @@ Video Translator Main Entry Point
 
 import os
 import sys
+import site
+import shutil
+import hashlib
 import logging
+import platform
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# 添加项目根目录到Python路径
-current_dir = Path(__file__).parent
-project_root = current_dir.parent
-sys.path.insert(0, str(project_root))
+# 添加项目根目录到Python路径（已在路径中时不重复添加）
+project_root = Path(__file__).resolve().parents[1]
+_project_root = str(project_root)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
-# 导入应用模块
+# 导入应用模块（GUI模块较重，延迟到依赖检查通过后再导入）
 try:
-    from src.gui.main_window import VideoTranslatorGUI
-    from src.utils.config import get_config, setup_logging
+    from src.utils.config import get_config
     from src.utils.logger import init_logger, get_logger
-    from src.utils.helpers import check_ffmpeg_available, get_system_info
+    from src.utils.helpers import check_ffmpeg_available
 except ImportError as e:
     print(f"导入模块失败: {e}")
     print("请确保所有依赖都已正确安装")
     sys.exit(1)
 
+# 设置 VT_EAGER_IMPORT=1 时立即导入GUI模块，便于在CI中尽早发现导入错误
+if os.environ.get('VT_EAGER_IMPORT') == '1':
+    import src.gui.main_window  # noqa: F401
+
+
+# 必要的Python包: (包名, 模块名)，tkinter单独检查
+_CHECKS = (
+    ('ttkthemes', 'ttkthemes'),
+    ('Pillow', 'PIL'),
+    ('ffmpeg-python', 'ffmpeg'),
+    ('pysrt', 'pysrt'),
+    ('webvtt-py', 'webvtt'),
+    ('openai', 'openai'),
+    ('anthropic', 'anthropic'),
+    ('requests', 'requests'),
+    ('PyYAML', 'yaml'),
+    ('tqdm', 'tqdm'),
+    ('colorama', 'colorama'),
+)
+
+
+# 依赖检查通过后写入的标记文件，内容为环境指纹
+DEPS_MARKER = project_root / 'logs' / '.deps_ok'
+
+
+def _env_fingerprint() -> str:
+    """计算运行环境指纹（Python版本、安装前缀、site-packages修改时间和FFmpeg路径）"""
+    parts = [sys.version, sys.prefix, shutil.which('ffmpeg') or '']
+
+    site_dirs = site.getsitepackages() if hasattr(site, 'getsitepackages') else []
+    for site_dir in site_dirs:
+        try:
+            parts.append(str(os.path.getmtime(site_dir)))
+        except OSError:
+            pass
+
+    return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _deps_marker_valid(fingerprint: str) -> bool:
+    """检查依赖标记是否与当前环境一致"""
+    try:
+        return DEPS_MARKER.read_text(encoding='utf-8') == fingerprint
+    except OSError:
+        return False
+
+
+def _write_deps_marker(fingerprint: str):
+    """记录依赖检查已通过"""
+    try:
+        DEPS_MARKER.parent.mkdir(parents=True, exist_ok=True)
+        DEPS_MARKER.write_text(fingerprint, encoding='utf-8')
+    except OSError:
+        pass
+
 
 def check_dependencies():
     """检查依赖环境"""
@@ -38,42 +100,17 @@ def check_dependencies():
     if not check_ffmpeg_available():
         issues.append("FFmpeg未找到，请安装FFmpeg")
 
-    # 检查必要的Python包
-    required_packages = [
-        'tkinter', 'ttkthemes', 'Pillow', 'ffmpeg-python',
-        'pysrt', 'webvtt-py', 'openai', 'anthropic',
-        'requests', 'PyYAML', 'tqdm', 'colorama'
-    ]
-
+    # 检查必要的Python包（只查找模块，不执行导入）
     missing_packages = []
-    for package in required_packages:
-        try:
-            if package == 'tkinter':
-                import tkinter
-            elif package == 'ttkthemes':
-                import ttkthemes
-            elif package == 'Pillow':
-                import PIL
-            elif package == 'ffmpeg-python':
-                import ffmpeg
-            elif package == 'pysrt':
-                import pysrt
-            elif package == 'webvtt-py':
-                import webvtt
-            elif package == 'openai':
-                import openai
-            elif package == 'anthropic':
-                import anthropic
-            elif package == 'requests':
-                import requests
-            elif package == 'PyYAML':
-                import yaml
-            elif package == 'tqdm':
-                import tqdm
-            elif package == 'colorama':
-                import colorama
-        except ImportError:
-            missing_packages.append(package)
+
+    # tkinter包可能存在但缺少_tkinter扩展，需要实际导入确认
+    try:
+        import tkinter
+    except ImportError:
+        missing_packages.append('tkinter')
+
+    missing_packages += [package for package, module_name in _CHECKS
+                         if importlib.util.find_spec(module_name) is None]
 
     if missing_packages:
         issues.append(f"缺少Python包: {', '.join(missing_packages)}")
@@ -86,16 +123,18 @@ def setup_environment():
     # 设置工作目录
     os.chdir(project_root)
 
-    # 创建必要的目录
-    directories = ['logs', 'output', 'temp']
-    for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+    def create_directories():
+        for directory in ('logs', 'output', 'temp'):
+            Path(directory).mkdir(exist_ok=True)
 
-    # 初始化配置
-    config = get_config()
+    # 创建必要的目录，同时加载配置（两者互不依赖）
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dirs_future = executor.submit(create_directories)
+        config_future = executor.submit(get_config)
+        config = config_future.result()
+        dirs_future.result()
 
     # 初始化日志系统
-    setup_logging()
     init_logger(config.get('logging', {}))
 
     return config
@@ -108,10 +147,9 @@ def print_startup_info():
     print("版本: 1.0.0")
     print("=" * 60)
 
-    # 打印系统信息
-    system_info = get_system_info()
-    print(f"操作系统: {system_info.get('platform', 'Unknown')}")
-    print(f"Python版本: {system_info.get('python_version', 'Unknown')}")
+    # 打印系统信息（无需调用get_system_info采集CPU、内存和磁盘信息）
+    print(f"操作系统: {platform.system()}")
+    print(f"Python版本: {platform.python_version()}")
     print(f"工作目录: {os.getcwd()}")
     print("-" * 60)
 
@@ -151,44 +189,72 @@ AZURE_TRANSLATOR_REGION=your_azure_region_here
             print(f"创建环境变量模板文件失败: {e}")
 
 
-def main():
+def check_env_files():
+    """创建环境变量模板并检查.env文件是否存在"""
+    create_env_template()
+
+    env_file = project_root / '.env'
+    if not env_file.exists():
+        print(f"\n⚠️  未找到 .env 文件")
+        print(f"请根据 .env.template 创建 .env 文件并配置API密钥")
+
+
+def show_error_dialog(message: str):
+    """显示错误对话框（延迟导入tkinter，不可用时仅保留控制台输出）"""
+    try:
+        import tkinter
+        from tkinter import messagebox
+
+        root = tkinter.Tk()
+        root.withdraw()
+        messagebox.showerror("视频翻译器", message, parent=root)
+        root.destroy()
+    except Exception:
+        pass
+
+
+def main(argv=None):
     """主函数"""
+    args = sys.argv[1:] if argv is None else argv
+
+    # --check-only: 只检查依赖环境，不导入和启动GUI
+    check_only = '--check-only' in args
+
     try:
         # 打印启动信息
         print_startup_info()
 
-        # 检查依赖
-        print("检查系统依赖...")
-        issues = check_dependencies()
-
-        if issues:
-            print("\n❌ 发现以下问题:")
-            for issue in issues:
-                print(f"  - {issue}")
-            print("\n请解决上述问题后重新运行程序")
-
-            # 如果只是缺少API密钥，可以继续运行
-            critical_issues = [issue for issue in issues if 'FFmpeg' in issue or 'Python' in issue or '包' in issue]
-            if critical_issues:
-                return 1
-            else:
-                print("\n⚠️  警告: 某些功能可能无法正常使用")
+        # 检查依赖（环境未变化时跳过）
+        fingerprint = _env_fingerprint()
+        if not check_only and _deps_marker_valid(fingerprint):
+            print("✅ 依赖检查通过（环境未变化）")
         else:
-            print("✅ 所有依赖检查通过")
+            print("检查系统依赖...")
+            issues = check_dependencies()
+
+            if issues:
+                print("\n❌ 发现以下问题:")
+                for issue in issues:
+                    print(f"  - {issue}")
+                print("\n请解决上述问题后重新运行程序")
+
+                # 如果只是缺少API密钥，可以继续运行
+                critical_issues = [issue for issue in issues if 'FFmpeg' in issue or 'Python' in issue or '包' in issue]
+                if critical_issues:
+                    return 1
+                else:
+                    print("\n⚠️  警告: 某些功能可能无法正常使用")
+            else:
+                print("✅ 所有依赖检查通过")
+                _write_deps_marker(fingerprint)
+
+        if check_only:
+            return 0
 
         # 设置环境
         print("初始化运行环境...")
         config = setup_environment()
 
-        # 创建环境变量模板
-        create_env_template()
-
-        # 检查是否存在.env文件
-        env_file = project_root / '.env'
-        if not env_file.exists():
-            print(f"\n⚠️  未找到 .env 文件")
-            print(f"请根据 .env.template 创建 .env 文件并配置API密钥")
-
         # 获取日志记录器
         logger = get_logger(__name__)
         logger.info("视频翻译器启动")
@@ -199,6 +265,16 @@ def main():
         print("启动图形界面...")
         print("-" * 60)
 
+        try:
+            from src.gui.main_window import VideoTranslatorGUI
+        except ImportError as e:
+            print(f"导入模块失败: {e}")
+            print("请确保所有依赖都已正确安装")
+            return 1
+
+        # 环境变量模板和.env检查不影响界面显示，放到后台线程执行
+        threading.Thread(target=check_env_files, daemon=True).start()
+
         app = VideoTranslatorGUI()
         app.run()
 
@@ -218,6 +294,9 @@ def main():
         except:
             pass
 
+        if not check_only:
+            show_error_dialog(f"程序运行出错: {e}")
+
         return 1
 
 
@@ -4,23 +4,302 @@
 """
 
 import os
+import re
+import copy
+import time
+import atexit
+import functools
+import threading
 import yaml
+from types import MappingProxyType
+from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dotenv import load_dotenv
+from typing import Dict, Any, Optional, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 优先使用libyaml的C实现，未安装时回退到纯Python实现
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+
+# 默认配置（模块加载时构建一次）
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'translation': {
+        'target_language': 'zh-CN',
+        'provider': 'openai',
+        'model': 'gpt-3.5-turbo',
+        'output_format': 'bilingual',  # bilingual 或 monolingual
+        'max_tokens': 2000,
+        'temperature': 0.3,
+        'batch_size': 10,  # 批量翻译大小
+        'retry_count': 3,
+        'timeout': 30
+    },
+    'subtitle': {
+        'max_chars_per_line': 50,
+        'max_lines': 2,
+        'sync_tolerance': 0.1,
+        'encoding': 'utf-8',
+        'formats': ['srt', 'vtt', 'ass'],
+        'auto_detect_language': True,
+        'merge_short_segments': True,
+        'min_segment_duration': 1.0
+    },
+    'video': {
+        'supported_formats': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'],
+        'ffmpeg_path': 'ffmpeg',
+        'extract_audio': False,
+        'audio_format': 'wav',
+        'audio_sample_rate': 16000
+    },
+    'ui': {
+        'theme': 'arc',
+        'language': 'zh_CN',
+        'window_size': '1200x800',
+        'remember_last_dir': True,
+        'auto_save_config': True,
+        'show_progress_details': True
+    },
+    'api': {
+        'openai': {
+            'base_url': 'https://api.openai.com/v1',
+            'models': ['gpt-3.5-turbo', 'gpt-4', 'gpt-4-turbo-preview']
+        },
+        'anthropic': {
+            'base_url': 'https://api.anthropic.com',
+            'models': ['claude-3-sonnet-20240229', 'claude-3-opus-20240229', 'claude-3-haiku-20240307']
+        },
+        'google': {
+            'project_id': None,
+            'location': 'global'
+        },
+        'azure': {
+            'endpoint': None,
+            'region': 'eastus'
+        },
+        'deepseek': {
+            'base_url': 'https://api.deepseek.com/v1',
+            'models': ['deepseek-chat', 'deepseek-coder']
+        },
+        'ollama': {
+            'base_url': 'http://localhost:11434/v1',
+            'models': ['llama2', 'llama2:13b', 'llama2:70b', 'codellama', 'mistral', 'mixtral', 'qwen', 'gemma']
+        }
+    },
+    'output': {
+        'default_dir': './output',
+        'filename_template': '{original_name}_{lang}_{format}',
+        'create_backup': True,
+        'overwrite_existing': False
+    },
+    'logging': {
+        'level': 'INFO',
+        'file': 'logs/app.log',
+        'max_size': '10MB',
+        'backup_count': 5,
+        'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    }
+}
+
+
+# 支持的语言列表
+_SUPPORTED_LANGUAGES: Dict[str, str] = {
+    'zh-CN': '简体中文',
+    'zh-TW': '繁体中文',
+    'en': 'English',
+    'ja': '日本語',
+    'ko': '한국어',
+    'fr': 'Français',
+    'de': 'Deutsch',
+    'es': 'Español',
+    'ru': 'Русский',
+    'ar': 'العربية',
+    'pt': 'Português',
+    'it': 'Italiano',
+    'nl': 'Nederlands',
+    'pl': 'Polski',
+    'tr': 'Türkçe',
+    'vi': 'Tiếng Việt',
+    'th': 'ไทย',
+    'hi': 'हिन्दी',
+    'bn': 'বাংলা',
+    'ms': 'Bahasa Melayu',
+    'id': 'Bahasa Indonesia',
+    'tl': 'Filipino',
+    'sv': 'Svenska',
+    'da': 'Dansk',
+    'no': 'Norsk',
+    'fi': 'Suomi',
+    'he': 'עברית',
+    'fa': 'فارسی',
+    'ur': 'اردو',
+    'sw': 'Kiswahili',
+    'am': 'አማርኛ',
+    'my': 'မြန်မာ',
+    'km': 'ខ្មែរ',
+    'lo': 'ລາວ',
+    'si': 'සිංහල',
+    'ne': 'नेपाली',
+    'ml': 'മലയാളം',
+    'ta': 'தமிழ்',
+    'te': 'తెలుగు',
+    'kn': 'ಕನ್ನಡ',
+    'gu': 'ગુજરાતી',
+    'pa': 'ਪੰਜਾਬੀ',
+    'or': 'ଓଡ଼ିଆ',
+    'as': 'অসমীয়া',
+    'mr': 'मराठी',
+    'sd': 'سنڌي',
+    'ps': 'پښتو',
+    'dv': 'ދިވެހި',
+    'bo': 'བོད་ཡིག',
+    'ug': 'ئۇيغۇرچە',
+    'kk': 'Қазақша',
+    'ky': 'Кыргызча',
+    'tg': 'Тоҷикӣ',
+    'uz': 'O\'zbekcha',
+    'mn': 'Монгол'
+}
+
+
+# 各翻译提供商对应的环境变量
+_API_KEY_ENV_VARS: Dict[str, str] = {
+    'openai': 'OPENAI_API_KEY',
+    'anthropic': 'ANTHROPIC_API_KEY',
+    'google': 'GOOGLE_APPLICATION_CREDENTIALS',
+    'azure': 'AZURE_TRANSLATOR_KEY',
+    'deepseek': 'DEEPSEEK_API_KEY',
+    'ollama': 'OLLAMA_BASE_URL'  # Ollama不需要API密钥，但可以通过环境变量配置URL
+}
+
+
+# 示例/默认API密钥（合并为一个忽略大小写的正则，一次扫描完成匹配）
+_EXAMPLE_KEY_RE = re.compile('|'.join(re.escape(key) for key in (
+    "your-api-key-here",
+    "sk-your-openai-api-key-here",
+    "your-azure-translator-key-here",
+    "sk-ant-REDACTED",
+    "your-deepseek-api-key-here",
+    "sk-your-deepseek-api-key-here"
+)), re.IGNORECASE)
+
+
+# 已解析的YAML文件缓存: 绝对路径 -> (mtime_ns, size, 只读数据)，按最近使用顺序淘汰
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, MappingProxyType]]" = OrderedDict()
+_YAML_CACHE_SIZE = 32
+_yaml_cache_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """递归转换为只读结构：dict -> MappingProxyType，list -> tuple"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """_freeze的逆操作，返回可自由修改的dict/list副本"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _load_yaml_cached(path: Path) -> MappingProxyType:
+    """加载YAML文件，修改时间和大小未变化时复用上次的解析结果
+
+    返回共享的只读数据（各层字典均为MappingProxyType，列表为tuple），
+    调用方需要修改时应先复制（见Config._merge_config）
+    """
+    key = os.path.abspath(path)
+    stat = path.stat()
+
+    with _yaml_cache_lock:
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            _YAML_CACHE.move_to_end(key)
+            return cached[2]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = _freeze(yaml.load(f, Loader=_SafeLoader) or {})
+
+    with _yaml_cache_lock:
+        _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+
+    return data
+
+
+def _load_env_file(path: Path):
+    """解析 KEY=VALUE 格式的.env文件，不覆盖已存在的环境变量"""
+    try:
+        content = path.read_text(encoding='utf-8')
+    except OSError as e:
+        logger.error(f"读取.env文件失败: {e}")
+        return
+
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+
+        if line.startswith('export '):
+            line = line[len('export '):]
+
+        key, _, value = line.partition('=')
+        key = key.strip()
+        value = value.strip()
+
+        if value[:1] in ('"', "'") and value[-1:] == value[:1] and len(value) >= 2:
+            value = value[1:-1]
+        elif ' #' in value:
+            # 去除未加引号的行内注释
+            value = value.split(' #', 1)[0].rstrip()
+
+        if key:
+            os.environ.setdefault(key, value)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """拆分点分割路径（结果缓存，常用配置键只拆分一次）"""
+    return tuple(key.split('.'))
+
 
 class Config:
     """配置管理类"""
 
+    # 自动保存的合并延迟（秒）
+    SAVE_DELAY = 0.5
+
+    # API配置验证结果的缓存时间（秒）
+    VALIDATE_TTL = 30.0
+
     def __init__(self, config_file: str = "config.yaml"):
         self.config_file = Path(config_file)
         self.api_keys_file = Path("api_keys.yaml")
         self.config_data = {}
         self.api_keys_data = {}
+        self._flat: Dict[str, Any] = {}  # 点分割路径 -> 值 的扁平索引
+        self._providers_cache: Optional[Dict[str, Dict[str, Any]]] = None  # 提供商静态信息缓存
+        self._validate_cache: Dict[str, Tuple[float, bool]] = {}  # 提供商 -> (验证时间, 结果)
+
+        # 延迟保存状态
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self._flush)
+
         self._load_env()
         self._load_config()
         self._load_api_keys()
@@ -29,14 +308,29 @@ class Config:
         """加载环境变量"""
         env_file = Path('.env')
         if env_file.exists():
-            load_dotenv(env_file)
+            _load_env_file(env_file)
+
+        self._snapshot_env()
+
+    def _snapshot_env(self):
+        """记录API密钥相关环境变量的快照，避免每次查询都访问os.environ"""
+        self._env_snapshot = {var: os.environ.get(var) for var in _API_KEY_ENV_VARS.values()}
+        self._validate_cache.clear()
+
+    def reload_env(self):
+        """重新读取.env文件和环境变量（环境变量在运行时被修改后调用）"""
+        self._load_env()
+
+    def reload_api_keys(self):
+        """重新读取api_keys.yaml、.env文件和环境变量（API密钥在运行时被修改后调用）"""
+        self._load_api_keys()
+        self._load_env()
 
     def _load_api_keys(self):
         """加载API密钥配置文件"""
         if self.api_keys_file.exists():
             try:
-                with open(self.api_keys_file, 'r', encoding='utf-8') as f:
-                    self.api_keys_data = yaml.safe_load(f) or {}
+                self.api_keys_data = _load_yaml_cached(self.api_keys_file)
                 logger.info(f"API密钥配置文件已加载: {self.api_keys_file}")
             except Exception as e:
                 logger.error(f"加载API密钥配置文件失败: {e}")
@@ -46,165 +340,159 @@ class Config:
             logger.info("未找到API密钥配置文件，将使用环境变量")
 
     def _get_default_config(self) -> Dict[str, Any]:
-        """获取默认配置"""
-        return {
-            'translation': {
-                'target_language': 'zh-CN',
-                'provider': 'openai',
-                'model': 'gpt-3.5-turbo',
-                'output_format': 'bilingual',  # bilingual 或 monolingual
-                'max_tokens': 2000,
-                'temperature': 0.3,
-                'batch_size': 10,  # 批量翻译大小
-                'retry_count': 3,
-                'timeout': 30
-            },
-            'subtitle': {
-                'max_chars_per_line': 50,
-                'max_lines': 2,
-                'sync_tolerance': 0.1,
-                'encoding': 'utf-8',
-                'formats': ['srt', 'vtt', 'ass'],
-                'auto_detect_language': True,
-                'merge_short_segments': True,
-                'min_segment_duration': 1.0
-            },
-            'video': {
-                'supported_formats': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'],
-                'ffmpeg_path': 'ffmpeg',
-                'extract_audio': False,
-                'audio_format': 'wav',
-                'audio_sample_rate': 16000
-            },
-            'ui': {
-                'theme': 'arc',
-                'language': 'zh_CN',
-                'window_size': '1200x800',
-                'remember_last_dir': True,
-                'auto_save_config': True,
-                'show_progress_details': True
-            },
-            'api': {
-                'openai': {
-                    'base_url': 'https://api.openai.com/v1',
-                    'models': ['gpt-3.5-turbo', 'gpt-4', 'gpt-4-turbo-preview']
-                },
-                'anthropic': {
-                    'base_url': 'https://api.anthropic.com',
-                    'models': ['claude-3-sonnet-20240229', 'claude-3-opus-20240229', 'claude-3-haiku-20240307']
-                },
-                'google': {
-                    'project_id': None,
-                    'location': 'global'
-                },
-                'azure': {
-                    'endpoint': None,
-                    'region': 'eastus'
-                },
-                'deepseek': {
-                    'base_url': 'https://api.deepseek.com/v1',
-                    'models': ['deepseek-chat', 'deepseek-coder']
-                },
-                'ollama': {
-                    'base_url': 'http://localhost:11434/v1',
-                    'models': ['llama2', 'llama2:13b', 'llama2:70b', 'codellama', 'mistral', 'mixtral', 'qwen', 'gemma']
-                }
-            },
-            'output': {
-                'default_dir': './output',
-                'filename_template': '{original_name}_{lang}_{format}',
-                'create_backup': True,
-                'overwrite_existing': False
-            },
-            'logging': {
-                'level': 'INFO',
-                'file': 'logs/app.log',
-                'max_size': '10MB',
-                'backup_count': 5,
-                'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            }
-        }
+        """获取默认配置（返回副本，调用方可自由修改）"""
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
     def _load_config(self):
         """加载配置文件"""
+        user_config = {}
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config_data = yaml.safe_load(f) or {}
+                user_config = _load_yaml_cached(self.config_file)
                 logger.info(f"配置文件已加载: {self.config_file}")
             except Exception as e:
                 logger.error(f"加载配置文件失败: {e}")
-                self.config_data = {}
-        else:
-            self.config_data = {}
 
-        # 合并默认配置
+        # 合并默认配置（合并结果不与YAML缓存共享可变对象）
         default_config = self._get_default_config()
-        self.config_data = self._merge_config(default_config, self.config_data)
+        if user_config:
+            self.config_data = self._merge_config(default_config, user_config)
+        else:
+            # 无用户配置时直接使用默认配置副本
+            self.config_data = default_config
+        self._rebuild_index()
 
         # 首次创建配置文件
         if not self.config_file.exists():
             self.save_config()
 
     def _merge_config(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
-        """递归合并配置"""
-        result = default.copy()
-
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_config(result[key], value)
-            else:
-                result[key] = value
-
-        return result
+        """将用户配置合并到默认配置中（就地修改default并返回）
+
+        default应为可修改的副本（如_get_default_config()的返回值）；
+        user可能是共享的只读缓存数据，取出的字典和列表会复制为可修改的dict/list
+        """
+        stack = [(default, user)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, Mapping) and isinstance(dst.get(key), dict):
+                    stack.append((dst[key], value))
+                elif isinstance(value, (Mapping, list, tuple)):
+                    dst[key] = _thaw(value)
+                else:
+                    dst[key] = value
+
+        return default
+
+    def _rebuild_index(self):
+        """重建点分割路径索引（包含中间层级的字典）"""
+        self._flat = {}
+        self._index_subtree('', self.config_data)
+
+    def _index_subtree(self, prefix: str, data: Dict[str, Any]):
+        """将字典data下的所有路径（以prefix为前缀）加入索引"""
+        flat = self._flat
+        stack = [(prefix, data)]
+        while stack:
+            prefix, data = stack.pop()
+            for k, v in data.items():
+                path = f"{prefix}.{k}" if prefix else str(k)
+                flat[path] = v
+                if isinstance(v, dict):
+                    stack.append((path, v))
 
     def get(self, key: str, default: Any = None) -> Any:
-        """获取配置值，支持点分割路径"""
-        keys = key.split('.')
-        data = self.config_data
+        """获取配置值，支持点分割路径
 
-        try:
-            for k in keys:
-                data = data[k]
-            return data
-        except (KeyError, TypeError):
-            return default
+        配置段（字典）返回副本：调用方修改返回值不会使点分割索引与config_data不一致，
+        需要修改配置时使用set()
+        """
+        value = self._flat.get(key, default)
+        if isinstance(value, dict):
+            return copy.deepcopy(value)
+        return value
 
     def set(self, key: str, value: Any, save: bool = True):
         """设置配置值，支持点分割路径"""
-        keys = key.split('.')
-        data = self.config_data
-
-        # 导航到最后一级
-        for k in keys[:-1]:
-            if k not in data or not isinstance(data[k], dict):
-                data[k] = {}
-            data = data[k]
+        keys = _split_key(key)
+
+        with self._lock:
+            data = self.config_data
+            flat = self._flat
+            path = ''
+
+            # 导航到最后一级（新建的中间层级同时加入索引）
+            for k in keys[:-1]:
+                path = f"{path}.{k}" if path else k
+                if k not in data or not isinstance(data[k], dict):
+                    data[k] = {}
+                    flat[path] = data[k]
+                data = data[k]
 
-        data[keys[-1]] = value
+            # 只更新被修改的子树，不重建整个索引
+            old_value = data.get(keys[-1])
+            if isinstance(old_value, dict):
+                stale_prefix = key + '.'
+                for stale_key in [k for k in flat if k.startswith(stale_prefix)]:
+                    del flat[stale_key]
+
+            # 字典值保存副本，调用方之后修改传入的字典不会绕过索引更新
+            if isinstance(value, dict):
+                value = copy.deepcopy(value)
+            data[keys[-1]] = value
+            flat[key] = value
+            if isinstance(value, dict):
+                self._index_subtree(key, value)
+
+            # 提供商信息和验证结果依赖api.*配置
+            if keys[0] == 'api':
+                self._providers_cache = None
+                self._validate_cache.clear()
 
         if save and self.get('ui.auto_save_config', True):
-            self.save_config()
+            self._schedule_save()
+
+    def _schedule_save(self):
+        """标记配置已修改，在SAVE_DELAY秒内没有新的修改时统一写入"""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.SAVE_DELAY, self._flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush(self):
+        """立即写入尚未保存的配置修改"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self.save_config()
 
     def save_config(self):
         """保存配置到文件"""
-        try:
-            # 确保目录存在
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._dirty = False
+            try:
+                # 确保目录存在
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config_data, f, default_flow_style=False,
-                         allow_unicode=True, indent=2)
-            logger.info(f"配置已保存到: {self.config_file}")
-        except Exception as e:
-            logger.error(f"保存配置文件失败: {e}")
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    yaml.dump(self.config_data, f, Dumper=_SafeDumper, default_flow_style=False,
+                             allow_unicode=True, indent=2)
+                logger.info(f"配置已保存到: {self.config_file}")
+            except Exception as e:
+                logger.error(f"保存配置文件失败: {e}")
 
     def get_api_key(self, provider: str) -> Optional[str]:
         """获取API密钥"""
         # 首先尝试从YAML配置文件获取
         if provider in self.api_keys_data:
             provider_config = self.api_keys_data[provider]
-            if isinstance(provider_config, dict):
+            if isinstance(provider_config, Mapping):
                 api_key = provider_config.get('api_key')
                 if api_key:
                     return api_key
@@ -212,18 +500,9 @@ class Config:
                 return provider_config
 
         # 然后尝试从环境变量获取
-        key_map = {
-            'openai': 'OPENAI_API_KEY',
-            'anthropic': 'ANTHROPIC_API_KEY',
-            'google': 'GOOGLE_APPLICATION_CREDENTIALS',
-            'azure': 'AZURE_TRANSLATOR_KEY',
-            'deepseek': 'DEEPSEEK_API_KEY',
-            'ollama': 'OLLAMA_BASE_URL'  # Ollama不需要API密钥，但可以通过环境变量配置URL
-        }
-
-        env_key = key_map.get(provider)
+        env_key = _API_KEY_ENV_VARS.get(provider)
         if env_key:
-            env_value = os.getenv(env_key)
+            env_value = self._env_snapshot.get(env_key)
             if env_value:
                 return env_value
 
@@ -234,24 +513,23 @@ class Config:
         return None
 
     def validate_api_config(self, provider: str) -> bool:
-        """验证API配置"""
+        """验证API配置（结果缓存VALIDATE_TTL秒）"""
+        now = time.monotonic()
+        cached = self._validate_cache.get(provider)
+        if cached is not None and now - cached[0] < self.VALIDATE_TTL:
+            return cached[1]
+
+        result = self._check_api_config(provider)
+        self._validate_cache[provider] = (now, result)
+        return result
+
+    def _check_api_config(self, provider: str) -> bool:
+        """检查API密钥和服务是否可用"""
         api_key = self.get_api_key(provider)
 
+        # Ollama不需要真实API密钥（get_api_key总会返回占位值），服务是否可用在实际连接时检查，
+        # 这里不做阻塞的网络探测
         if not api_key:
-            # Ollama不需要真实API密钥
-            if provider == 'ollama':
-                # 尝试检查Ollama服务是否可用
-                try:
-                    import requests
-                    base_url = self.get('api.ollama.base_url', 'http://localhost:11434/v1')
-                    response = requests.get(f"{base_url.rstrip('/v1')}/api/version", timeout=2)
-                    if response.status_code == 200:
-                        return True
-                    logger.warning(f"Ollama服务不可用: {response.status_code}")
-                    return False
-                except Exception as e:
-                    logger.warning(f"Ollama服务不可访问: {e}")
-                    return False
             logger.warning(f"未找到 {provider} 的API密钥")
             return False
 
@@ -268,84 +546,30 @@ class Config:
             return False
 
         # 检查是否为示例/默认密钥
-        example_keys = [
-            "your-api-key-here",
-            "sk-your-openai-api-key-here",
-            "your-azure-translator-key-here",
-            "sk-ant-REDACTED",
-            "your-deepseek-api-key-here",
-            "sk-your-deepseek-api-key-here"
-        ]
-
-        if isinstance(api_key, str) and any(example in api_key.lower() for example in example_keys):
+        if isinstance(api_key, str) and _EXAMPLE_KEY_RE.search(api_key):
             logger.warning(f"{provider} 使用了示例API密钥")
             return False
 
         return True
 
     def get_supported_languages(self) -> Dict[str, str]:
-        """获取支持的语言列表"""
-        return {
-            'zh-CN': '简体中文',
-            'zh-TW': '繁体中文',
-            'en': 'English',
-            'ja': '日本語',
-            'ko': '한국어',
-            'fr': 'Français',
-            'de': 'Deutsch',
-            'es': 'Español',
-            'ru': 'Русский',
-            'ar': 'العربية',
-            'pt': 'Português',
-            'it': 'Italiano',
-            'nl': 'Nederlands',
-            'pl': 'Polski',
-            'tr': 'Türkçe',
-            'vi': 'Tiếng Việt',
-            'th': 'ไทย',
-            'hi': 'हिन्दी',
-            'bn': 'বাংলা',
-            'ms': 'Bahasa Melayu',
-            'id': 'Bahasa Indonesia',
-            'tl': 'Filipino',
-            'sv': 'Svenska',
-            'da': 'Dansk',
-            'no': 'Norsk',
-            'fi': 'Suomi',
-            'he': 'עברית',
-            'fa': 'فارسی',
-            'ur': 'اردو',
-            'sw': 'Kiswahili',
-            'am': 'አማርኛ',
-            'my': 'မြန်မာ',
-            'km': 'ខ្មែរ',
-            'lo': 'ລາວ',
-            'si': 'සිංහල',
-            'ne': 'नेपाली',
-            'ml': 'മലയാളം',
-            'ta': 'தமிழ்',
-            'te': 'తెలుగు',
-            'kn': 'ಕನ್ನಡ',
-            'gu': 'ગુજરાતી',
-            'pa': 'ਪੰਜਾਬੀ',
-            'or': 'ଓଡ଼ିଆ',
-            'as': 'অসমীয়া',
-            'mr': 'मराठी',
-            'sd': 'سنڌي',
-            'ps': 'پښتو',
-            'dv': 'ދިވެހި',
-            'bo': 'བོད་ཡིག',
-            'ug': 'ئۇيغۇرچە',
-            'kk': 'Қазақша',
-            'ky': 'Кыргызча',
-            'tg': 'Тоҷикӣ',
-            'uz': 'O\'zbekcha',
-            'mn': 'Монгол'
-        }
+        """获取支持的语言列表（只读，调用方不应修改）"""
+        return _SUPPORTED_LANGUAGES
 
     def get_translation_providers(self) -> Dict[str, Dict[str, Any]]:
         """获取翻译提供商信息"""
-        providers_info = {
+        if self._providers_cache is None:
+            self._providers_cache = self._build_providers_info()
+
+        # 可用状态依赖API密钥和环境变量，每次重新检查
+        return {
+            provider_key: dict(info, available=self.validate_api_config(provider_key))
+            for provider_key, info in self._providers_cache.items()
+        }
+
+    def _build_providers_info(self) -> Dict[str, Dict[str, Any]]:
+        """构建翻译提供商的静态信息（名称、模型列表、描述）"""
+        return {
             'openai': {
                 'name': 'OpenAI GPT',
                 'models': self.get('api.openai.models', []),
@@ -384,12 +608,6 @@ class Config:
             }
         }
 
-        # 更新是否可用的状态
-        for provider_key in providers_info:
-            providers_info[provider_key]['available'] = self.validate_api_config(provider_key)
-
-        return providers_info
-
     def update_last_used_dir(self, directory: str):
         """更新最后使用的目录"""
         if self.get('ui.remember_last_dir', True):
@@ -410,35 +628,20 @@ class Config:
     def reset_to_defaults(self):
         """重置为默认配置"""
         self.config_data = self._get_default_config()
+        self._rebuild_index()
+        self._providers_cache = None
+        self._validate_cache.clear()
         self.save_config()
         logger.info("配置已重置为默认值")
 
 
-# 全局配置实例
-config = Config()
+# 全局配置实例（首次调用get_config时创建）
+_config: Optional[Config] = None
 
 
 def get_config() -> Config:
     """获取全局配置实例"""
-    return config
-
-
-def setup_logging():
-    """设置日志配置"""
-    log_config = config.get('logging', {})
-    log_level = getattr(logging, log_config.get('level', 'INFO').upper())
-    log_format = log_config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    log_file = log_config.get('file', 'logs/app.log')
-
-    # 创建日志目录
-    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
-
-    # 配置日志
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
@@ -6,83 +6,116 @@
 import os
 import re
 import hashlib
-import mimetypes
-import subprocess
 import tempfile
 import shutil
 import time
 import functools
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union, Tuple, Callable
+from typing import List, Dict, Any, Optional, Union, Tuple, Callable, Iterable, Iterator
 from datetime import datetime, timedelta
 import unicodedata
 import json
 import threading
 import queue
 import platform
-import psutil
 from urllib.parse import urlparse
-import chardet
+
+
+# 预编译的正则表达式（字幕处理时按片段频繁调用）
+# HTML标签、{格式标记}和\N换行符合并为一次扫描，换行符（分组1）替换为空格
+_RE_STRIP = re.compile(r'<[^>]+>|\{[^}]*\}|(\\[NnRr])')
+_RE_WS = re.compile(r'\s+')
+_RE_SENT = re.compile(r'[.!?。！？]+')
+_RE_BLANKLINE = re.compile(r'\n\s*\n')
+_RE_PUNCT_SPACE = re.compile(r'([.!?])\s*([A-Z])')
+_RE_SPACE_PUNCT = re.compile(r'\s+([,.!?;:])')
+
+# 文件名清理表：不合法字符替换为下划线，控制字符直接删除
+_SAFE_FILENAME_TABLE = {ord(char): '_' for char in '<>:"/\\|?*'}
+_SAFE_FILENAME_TABLE.update({code: None for code in range(32)})
+
+# 文件大小单位
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# 支持的视频文件扩展名
+_VIDEO_EXTENSIONS = frozenset({
+    '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm',
+    '.m4v', '.3gp', '.f4v', '.asf', '.rm', '.rmvb', '.vob',
+    '.ogv', '.drc', '.gif', '.gifv', '.mng', '.qt', '.yuv',
+    '.amv', '.m4p', '.mpg', '.mp2', '.mpeg', '.mpe', '.mpv',
+    '.m2v', '.svi', '.3g2', '.mxf', '.roq', '.nsv'
+})
+
+# 字幕时间戳: SRT为 HH:MM:SS,mmm，VTT为 [HH:]MM:SS.mmm
+_RE_SRT_TIME = re.compile(r'(\d+):(\d+):(\d+)(?:[,.](\d+))?')
+_RE_VTT_TIME = re.compile(r'(?:(\d+):)?(\d+):(\d+)(?:\.(\d+))?')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_static_system_info() -> Tuple[Tuple[str, Any], ...]:
+    """获取进程生命周期内不变的系统信息（只采集一次）"""
+    import psutil
+
+    return (
+        ('platform', platform.system()),
+        ('platform_version', platform.version()),
+        ('architecture', platform.architecture()[0]),
+        ('processor', platform.processor()),
+        ('python_version', platform.python_version()),
+        ('cpu_count', psutil.cpu_count()),
+        ('memory_total', psutil.virtual_memory().total),
+    )
 
 
 def get_system_info() -> Dict[str, Any]:
     """获取系统信息"""
     try:
-        return {
-            'platform': platform.system(),
-            'platform_version': platform.version(),
-            'architecture': platform.architecture()[0],
-            'processor': platform.processor(),
-            'python_version': platform.python_version(),
-            'cpu_count': psutil.cpu_count(),
-            'memory_total': psutil.virtual_memory().total,
-            'memory_available': psutil.virtual_memory().available,
-            'disk_free': psutil.disk_usage('/').free if platform.system() != 'Windows' else psutil.disk_usage('C:').free
-        }
+        import psutil
+
+        info = dict(_get_static_system_info())
+
+        # 可用内存和磁盘空间随时变化，每次重新获取
+        info['memory_available'] = psutil.virtual_memory().available
+        info['disk_free'] = psutil.disk_usage('/').free if info['platform'] != 'Windows' else psutil.disk_usage('C:').free
+        return info
     except Exception:
         return {'platform': platform.system(), 'python_version': platform.python_version()}
 
 
 def is_video_file(file_path: Union[str, Path]) -> bool:
     """检查文件是否为视频文件"""
-    video_extensions = {
-        '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm',
-        '.m4v', '.3gp', '.f4v', '.asf', '.rm', '.rmvb', '.vob',
-        '.ogv', '.drc', '.gif', '.gifv', '.mng', '.avi', '.mov',
-        '.qt', '.wmv', '.yuv', '.rm', '.rmvb', '.asf', '.amv',
-        '.mp4', '.m4p', '.m4v', '.mpg', '.mp2', '.mpeg', '.mpe',
-        '.mpv', '.mpg', '.mpeg', '.m2v', '.m4v', '.svi', '.3gp',
-        '.3g2', '.mxf', '.roq', '.nsv'
-    }
-
     file_path = Path(file_path)
-    if not file_path.exists():
-        return False
 
-    # 检查扩展名
-    if file_path.suffix.lower() not in video_extensions:
-        return False
+    # 先检查扩展名（无需系统调用），再确认文件存在
+    return file_path.suffix.lower() in _VIDEO_EXTENSIONS and file_path.exists()
 
-    # 检查MIME类型
-    mime_type, _ = mimetypes.guess_type(str(file_path))
-    if mime_type and mime_type.startswith('video/'):
-        return True
 
-    return file_path.suffix.lower() in video_extensions
+def _scan_files(directory: str, recursive: bool):
+    """遍历目录中的文件（使用DirEntry缓存的类型信息，避免额外的stat调用）"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        yield entry
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        yield from _scan_files(entry.path, True)
+                except OSError:
+                    continue
+    except OSError:
+        return
 
 
 def get_video_files_in_directory(directory: Union[str, Path], recursive: bool = False) -> List[Path]:
     """获取目录中的所有视频文件"""
-    directory = Path(directory)
-    if not directory.exists() or not directory.is_dir():
+    if not os.path.isdir(directory):
         return []
 
     video_files = []
-    pattern = "**/*" if recursive else "*"
-
-    for file_path in directory.glob(pattern):
-        if file_path.is_file() and is_video_file(file_path):
-            video_files.append(file_path)
+    for entry in _scan_files(os.fspath(directory), recursive):
+        if os.path.splitext(entry.name)[1].lower() in _VIDEO_EXTENSIONS:
+            video_files.append(Path(entry.path))
 
     return sorted(video_files)
 
@@ -95,18 +128,16 @@ def get_file_size(file_path: Union[str, Path]) -> int:
         return 0
 
 
+@functools.lru_cache(maxsize=1024)
 def format_file_size(size_bytes: int) -> str:
     """格式化文件大小显示"""
     if size_bytes == 0:
         return "0 B"
 
-    size_names = ["B", "KB", "MB", "GB", "TB", "PB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    # 由二进制位数直接得到单位下标（每1024倍为10位）
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1) if size_bytes > 0 else 0
 
-    return f"{size_bytes:.2f} {size_names[i]}"
+    return f"{size_bytes / (1 << (i * 10)):.2f} {_SIZE_NAMES[i]}"
 
 
 def format_duration(seconds: float) -> str:
@@ -124,65 +155,54 @@ def format_duration(seconds: float) -> str:
         return f"{hours}小时{minutes}分{secs:.1f}秒"
 
 
+def _match_to_seconds(match: Optional[re.Match]) -> float:
+    """将时间戳正则匹配结果(时, 分, 秒, 毫秒)转换为秒数"""
+    if match is None:
+        return 0.0
+
+    hours, minutes, seconds, milliseconds = match.groups()
+    total = int(minutes) * 60 + int(seconds)
+    if hours:
+        total += int(hours) * 3600
+    if milliseconds:
+        return total + int(milliseconds) / 1000.0
+    return float(total)
+
+
+def _seconds_to_timestamp(seconds: float, ms_separator: str) -> str:
+    """将秒数转换为 HH:MM:SS<分隔符>mmm 格式"""
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(int(minutes), 60)
+    milliseconds = int((seconds % 1) * 1000)
+
+    return f"{hours:02d}:{minutes:02d}:{int(secs):02d}{ms_separator}{milliseconds:03d}"
+
+
 def srt_time_to_seconds(time_str: str) -> float:
     """将SRT时间格式转换为秒数"""
     # 格式: 00:00:00,000
-    try:
-        time_parts = time_str.split(',')
-        hms = time_parts[0].split(':')
-        hours = int(hms[0])
-        minutes = int(hms[1])
-        seconds = int(hms[2])
-        milliseconds = int(time_parts[1]) if len(time_parts) > 1 else 0
-
-        total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
-        return total_seconds
-    except (ValueError, IndexError):
-        return 0.0
+    return _match_to_seconds(_RE_SRT_TIME.match(time_str.strip()))
 
 
 def seconds_to_srt_time(seconds: float) -> str:
     """将秒数转换为SRT时间格式"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds % 1) * 1000)
-
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+    return _seconds_to_timestamp(seconds, ',')
 
 
 def vtt_time_to_seconds(time_str: str) -> float:
     """将VTT时间格式转换为秒数"""
-    # 格式: 00:00:00.000
-    try:
-        time_parts = time_str.split('.')
-        hms = time_parts[0].split(':')
-
-        if len(hms) == 2:  # MM:SS format
-            minutes = int(hms[0])
-            seconds = int(hms[1])
-            hours = 0
-        else:  # HH:MM:SS format
-            hours = int(hms[0])
-            minutes = int(hms[1])
-            seconds = int(hms[2])
-
-        milliseconds = int(time_parts[1]) if len(time_parts) > 1 else 0
-
-        total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000.0
-        return total_seconds
-    except (ValueError, IndexError):
-        return 0.0
+    # 格式: 00:00:00.000 或 00:00.000
+    return _match_to_seconds(_RE_VTT_TIME.match(time_str.strip()))
 
 
 def seconds_to_vtt_time(seconds: float) -> str:
     """将秒数转换为VTT时间格式"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds % 1) * 1000)
+    return _seconds_to_timestamp(seconds, '.')
 
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+
+def _strip_replacement(match: re.Match) -> str:
+    """_RE_STRIP的替换函数：换行符替换为空格，其余标记直接删除"""
+    return ' ' if match.group(1) else ''
 
 
 def clean_text(text: str) -> str:
@@ -190,21 +210,14 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
 
-    # 移除HTML标签
-    text = re.sub(r'<[^>]+>', '', text)
-
-    # 移除字幕格式标记
-    text = re.sub(r'\{[^}]*\}', '', text)  # 移除 {formatting}
-    text = re.sub(r'\\[NnRr]', ' ', text)  # 移除换行符
+    # 移除HTML标签和字幕格式标记，换行符替换为空格
+    text = _RE_STRIP.sub(_strip_replacement, text)
 
     # 标准化Unicode字符
     text = unicodedata.normalize('NFKC', text)
 
     # 移除多余的空白字符
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-
-    return text
+    return _RE_WS.sub(' ', text).strip()
 
 
 def split_text_by_length(text: str, max_length: int = 500, preserve_sentences: bool = True) -> List[str]:
@@ -216,7 +229,7 @@ def split_text_by_length(text: str, max_length: int = 500, preserve_sentences: b
 
     if preserve_sentences:
         # 按句号、问号、感叹号分割
-        sentences = re.split(r'[.!?。！？]+', text)
+        sentences = _RE_SENT.split(text)
         current_chunk = ""
 
         for sentence in sentences:
@@ -242,23 +255,26 @@ def split_text_by_length(text: str, max_length: int = 500, preserve_sentences: b
 
 
 def detect_text_encoding(file_path: Union[str, Path]) -> str:
-    """检测文本文件编码"""
+    """检测文本文件编码（分块读取，检测结果确定后立即停止）"""
     try:
+        import chardet
+
+        detector = chardet.UniversalDetector()
         with open(file_path, 'rb') as f:
-            raw_data = f.read()
-            result = chardet.detect(raw_data)
-            return result['encoding'] or 'utf-8'
+            for chunk in iter(lambda: f.read(8192), b""):
+                detector.feed(chunk)
+                if detector.done:
+                    break
+        detector.close()
+        return detector.result.get('encoding') or 'utf-8'
     except Exception:
         return 'utf-8'
 
 
 def safe_filename(filename: str) -> str:
     """生成安全的文件名，移除不合法字符"""
-    # 移除不合法字符
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-
-    # 移除控制字符
-    filename = ''.join(char for char in filename if ord(char) >= 32)
+    # 替换不合法字符并移除控制字符
+    filename = filename.translate(_SAFE_FILENAME_TABLE)
 
     # 限制长度
     if len(filename) > 200:
@@ -306,13 +322,18 @@ def create_backup_file(file_path: Union[str, Path]) -> Optional[Path]:
 
 def calculate_file_hash(file_path: Union[str, Path], algorithm: str = 'md5') -> str:
     """计算文件哈希值"""
-    hash_func = getattr(hashlib, algorithm.lower())()
+    algorithm = algorithm.lower()
 
     try:
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            # Python 3.11+ 在C层完成读取和哈希计算
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, algorithm).hexdigest()
+
+            hash_func = hashlib.new(algorithm)
+            for chunk in iter(lambda: f.read(1 << 20), b""):
                 hash_func.update(chunk)
-        return hash_func.hexdigest()
+            return hash_func.hexdigest()
     except Exception:
         return ""
 
@@ -351,23 +372,33 @@ def validate_url(url: str) -> bool:
 
 
 def flatten_dict(d: Dict[str, Any], parent_key: str = '', sep: str = '.') -> Dict[str, Any]:
-    """扁平化嵌套字典"""
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
+    """扁平化嵌套字典（使用显式栈代替递归，保持键的原有顺序）"""
+    items = {}
+    stack = [(parent_key, iter(d.items()))]
+
+    while stack:
+        prefix, entries = stack[-1]
+        for k, v in entries:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                # 先处理子字典，处理完后继续当前层级剩余的键
+                stack.append((new_key, iter(v.items())))
+                break
+            items[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
 
+    return items
 
-def batch_process(items: List[Any], batch_size: int = 10) -> List[List[Any]]:
-    """将列表分批处理"""
-    batches = []
-    for i in range(0, len(items), batch_size):
-        batches.append(items[i:i + batch_size])
-    return batches
+
+def batch_process(items: Iterable[Any], batch_size: int = 10) -> Iterator[List[Any]]:
+    """将列表分批处理（生成器，按需产生每一批）"""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
 
 
 def progress_callback(current: int, total: int, callback: Optional[Callable] = None):
@@ -396,8 +427,8 @@ class ThreadSafeCounter:
 
     @property
     def value(self) -> int:
-        with self._lock:
-            return self._value
+        # 读取单个int引用是原子操作，无需加锁
+        return self._value
 
     def reset(self):
         with self._lock:
@@ -444,8 +475,11 @@ class ProgressTracker:
             self.start_time = time.time()
 
 
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg_available() -> bool:
-    """检查FFmpeg是否可用"""
+    """检查FFmpeg是否可用（结果缓存，安装FFmpeg后需调用cache_clear()或重启程序）"""
+    import subprocess
+
     try:
         subprocess.run(['ffmpeg', '-version'],
                       capture_output=True,
@@ -487,15 +521,15 @@ def sanitize_subtitle_text(text: str) -> str:
         return ""
 
     # 移除多余的空行
-    text = re.sub(r'\n\s*\n', '\n', text)
+    text = _RE_BLANKLINE.sub('\n', text)
 
     # 移除行首行尾空格
     lines = [line.strip() for line in text.split('\n')]
     text = '\n'.join(line for line in lines if line)
 
     # 处理常见的字幕格式问题
-    text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)  # 句子间添加空格
-    text = re.sub(r'\s+([,.!?;:])', r'\1', text)  # 移除标点前的空格
+    text = _RE_PUNCT_SPACE.sub(r'\1 \2', text)  # 句子间添加空格
+    text = _RE_SPACE_PUNCT.sub(r'\1', text)  # 移除标点前的空格
 
     return text
 
@@ -3,10 +3,16 @@
 提供统一的日志管理功能，支持文件输出、控制台输出、日志轮转等
 """
 
+import io
 import os
+import re
 import sys
+import queue
+import atexit
 import logging
+import threading
 import logging.handlers
+from collections import deque
 from pathlib import Path
 from typing import Optional, Dict, Any
 import time
@@ -31,17 +37,44 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Fore.RED + Back.WHITE + Style.BRIGHT,
     }
 
+    # 预先拼接好的带颜色级别名称
+    COLORED_LEVELS = {level: f"{color}{level}{Style.RESET_ALL}" for level, color in COLORS.items()}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored_names: Dict[str, str] = {}  # 模块名 -> 带颜色的模块名
+
     def format(self, record):
-        # 为日志级别添加颜色
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{Style.RESET_ALL}"
+        levelname, name = record.levelname, record.name
+
+        # 为日志级别和模块名添加颜色
+        colored_name = self._colored_names.get(name)
+        if colored_name is None:
+            colored_name = self._colored_names[name] = f"{Fore.BLUE}{name}{Style.RESET_ALL}"
+
+        record.levelname = self.COLORED_LEVELS.get(levelname, levelname)
+        record.name = colored_name
+        try:
+            return super().format(record)
+        finally:
+            # 恢复原值，避免影响其他处理器
+            record.levelname, record.name = levelname, name
 
-        # 为模块名添加颜色
-        if hasattr(record, 'name'):
-            record.name = f"{Fore.BLUE}{record.name}{Style.RESET_ALL}"
 
-        return super().format(record)
+# 当前进程的psutil句柄，首次使用时创建（psutil导入较慢，不在模块加载时导入）；False表示psutil不可用
+_process = None
+
+
+def _get_process():
+    """获取缓存的psutil.Process，psutil未安装时返回None"""
+    global _process
+    if _process is None:
+        try:
+            import psutil
+            _process = psutil.Process()
+        except ImportError:
+            _process = False
+    return _process or None
 
 
 class PerformanceLogger:
@@ -56,21 +89,19 @@ class PerformanceLogger:
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
                 name = func_name or f"{func.__module__}.{func.__name__}"
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 try:
                     result = func(*args, **kwargs)
-                    end_time = time.time()
-                    duration = end_time - start_time
+                    duration = time.perf_counter() - start_time
 
-                    self.logger.info(f"⏱️ {name} 执行完成，耗时: {duration:.3f}s")
+                    self.logger.info("⏱️ %s 执行完成，耗时: %.3fs", name, duration)
                     return result
 
                 except Exception as e:
-                    end_time = time.time()
-                    duration = end_time - start_time
+                    duration = time.perf_counter() - start_time
 
-                    self.logger.error(f"❌ {name} 执行失败，耗时: {duration:.3f}s，错误: {str(e)}")
+                    self.logger.error("❌ %s 执行失败，耗时: %.3fs，错误: %s", name, duration, e)
                     raise
 
             return wrapper
@@ -78,87 +109,247 @@ class PerformanceLogger:
 
     def log_memory_usage(self, description: str = ""):
         """记录内存使用情况"""
-        try:
-            import psutil
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
-
-            self.logger.info(f"💾 内存使用 {description}: {memory_mb:.2f} MB")
-        except ImportError:
+        process = _get_process()
+        if process is None:
             self.logger.debug("psutil未安装，无法获取内存使用信息")
+            return
+
+        memory_mb = process.memory_info().rss / (1 << 20)
+        self.logger.info("💾 内存使用 %s: %.2f MB", description, memory_mb)
+
+
+class TranslationStats:
+    """翻译统计信息（使用__slots__，每个片段更新时直接访问属性而不是查字典）
+
+    errors最多保留max_errors条最近的错误，更早的会被丢弃；failed_segments始终是完整计数
+    """
+
+    __slots__ = ('total_segments', 'translated_segments', 'failed_segments',
+                 'total_chars', 'start_time', 'errors')
+
+    def __init__(self, total_segments: int = 0, start_time: Optional[float] = None,
+                 max_errors: int = 1000):
+        self.total_segments = total_segments
+        self.translated_segments = 0
+        self.failed_segments = 0
+        self.total_chars = 0
+        self.start_time = start_time
+        self.errors: deque = deque(maxlen=max_errors)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """转换为字典（用于序列化）"""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class TranslationLogger:
     """翻译专用日志记录器"""
 
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, max_errors: int = 1000):
         self.logger = logger
-        self.translation_stats = {
-            'total_segments': 0,
-            'translated_segments': 0,
-            'failed_segments': 0,
-            'total_chars': 0,
-            'start_time': None,
-            'errors': []
-        }
+        self.max_errors = max_errors
+        self.translation_stats = TranslationStats(max_errors=max_errors)
 
     def start_translation(self, total_segments: int):
         """开始翻译任务"""
-        self.translation_stats.update({
-            'total_segments': total_segments,
-            'translated_segments': 0,
-            'failed_segments': 0,
-            'total_chars': 0,
-            'start_time': time.time(),
-            'errors': []
-        })
+        self.translation_stats = TranslationStats(total_segments, time.perf_counter(), self.max_errors)
 
-        self.logger.info(f"🚀 开始翻译任务，总计 {total_segments} 个片段")
+        self.logger.info("🚀 开始翻译任务，总计 %d 个片段", total_segments)
 
     def log_segment_translated(self, segment_index: int, char_count: int, provider: str):
         """记录片段翻译完成"""
-        self.translation_stats['translated_segments'] += 1
-        self.translation_stats['total_chars'] += char_count
+        stats = self.translation_stats
+        stats.translated_segments += 1
+        stats.total_chars += char_count
 
-        progress = (self.translation_stats['translated_segments'] /
-                   self.translation_stats['total_segments'] * 100)
+        progress = stats.translated_segments / stats.total_segments * 100
 
         self.logger.info(
-            f"✅ 片段 {segment_index + 1}/{self.translation_stats['total_segments']} "
-            f"翻译完成 ({progress:.1f}%) - {provider} - {char_count} 字符"
+            "✅ 片段 %d/%d 翻译完成 (%.1f%%) - %s - %d 字符",
+            segment_index + 1, stats.total_segments, progress, provider, char_count
         )
 
     def log_segment_failed(self, segment_index: int, error: str):
         """记录片段翻译失败"""
-        self.translation_stats['failed_segments'] += 1
-        self.translation_stats['errors'].append({
+        stats = self.translation_stats
+        stats.failed_segments += 1
+        stats.errors.append({
             'segment': segment_index,
             'error': error,
             'timestamp': datetime.now().isoformat()
         })
 
-        self.logger.error(f"❌ 片段 {segment_index + 1} 翻译失败: {error}")
+        self.logger.error("❌ 片段 %d 翻译失败: %s", segment_index + 1, error)
 
     def finish_translation(self):
         """完成翻译任务"""
-        if self.translation_stats['start_time']:
-            duration = time.time() - self.translation_stats['start_time']
+        stats = self.translation_stats
+        if stats.start_time:
+            duration = time.perf_counter() - stats.start_time
 
-            success_rate = (self.translation_stats['translated_segments'] /
-                          self.translation_stats['total_segments'] * 100)
+            success_rate = stats.translated_segments / stats.total_segments * 100
 
             self.logger.info(
-                f"🎉 翻译任务完成！\n"
-                f"   总时间: {duration:.2f}s\n"
-                f"   成功率: {success_rate:.1f}% "
-                f"({self.translation_stats['translated_segments']}/{self.translation_stats['total_segments']})\n"
-                f"   失败数: {self.translation_stats['failed_segments']}\n"
-                f"   总字符数: {self.translation_stats['total_chars']}"
+                "🎉 翻译任务完成！\n"
+                "   总时间: %.2fs\n"
+                "   成功率: %.1f%% (%d/%d)\n"
+                "   失败数: %d\n"
+                "   总字符数: %d",
+                duration, success_rate, stats.translated_segments, stats.total_segments,
+                stats.failed_segments, stats.total_chars
             )
 
-            if self.translation_stats['errors']:
-                self.logger.warning(f"⚠️ 有 {len(self.translation_stats['errors'])} 个错误需要注意")
+            if stats.failed_segments:
+                self.logger.warning("⚠️ 有 %d 个错误需要注意", stats.failed_segments)
+
+
+# 文件大小字符串（如 10MB、512K、1.5G）
+_SIZE_RE = re.compile(r'^\s*([\d.]+)\s*(GB|G|MB|M|KB|K|B)?\s*$', re.IGNORECASE)
+_SIZE_MULTIPLIERS = {
+    'GB': 1 << 30, 'G': 1 << 30,
+    'MB': 1 << 20, 'M': 1 << 20,
+    'KB': 1 << 10, 'K': 1 << 10,
+    'B': 1, '': 1
+}
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """带写缓冲的轮转文件处理器
+
+    普通记录写入缓冲区后不立即flush，由后台日志线程在队列清空时统一刷新；
+    ERROR及以上级别的记录立即写盘
+    """
+
+    def __init__(self, *args, buffer_size: int = 65536, **kwargs):
+        self.buffer_size = buffer_size
+        self._in_emit = False
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        # 文本层直接写入二进制缓冲区（write_through），缓冲区位置即为文件大小
+        raw = open(self.baseFilename, self.mode + 'b', buffering=self.buffer_size)
+        return io.TextIOWrapper(raw, encoding=self.encoding, write_through=True)
+
+    def shouldRollover(self, record) -> bool:
+        # 使用底层缓冲区的位置判断文件大小（不会像seek/tell那样强制刷新缓冲区），
+        # 因此文件会在超过maxBytes后的下一条记录时轮转
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        return self.stream.buffer.tell() >= self.maxBytes
+
+    def emit(self, record):
+        self._in_emit = True
+        try:
+            super().emit(record)
+        finally:
+            self._in_emit = False
+
+        if record.levelno >= logging.ERROR:
+            self.flush()
+
+    def flush(self):
+        # StreamHandler.emit每写一条记录都会调用flush，这里跳过
+        if not self._in_emit:
+            super().flush()
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """队列清空、即将等待新记录时刷新所有处理器，连续的日志记录合并为一次写盘
+
+    队列已满时溢出到_error_overflow的ERROR记录在取下一条队列记录时一并写出
+    （溢出只在队列满时发生，队列中总有后续记录或停止标记）
+    """
+
+    def dequeue(self, block):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        record = self.queue.get(block)
+        while _error_overflow:
+            self.handle(_error_overflow.popleft())
+        return record
+
+    def enqueue_sentinel(self):
+        # 队列有上限，停止时等待空位放入结束标记
+        self.queue.put(self._sentinel)
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """任何情况下都不阻塞调用线程（如asyncio事件循环）的QueueHandler
+
+    队列已满时DEBUG～WARNING记录直接丢弃；ERROR及以上级别放入有上限的溢出缓冲区，
+    由后台日志线程优先写出，溢出缓冲区也满时丢弃最早的一条。丢弃的记录数记在dropped中
+    """
+
+    def __init__(self, queue_):
+        super().__init__(queue_)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno >= logging.ERROR:
+                if len(_error_overflow) == _error_overflow.maxlen:
+                    self.dropped += 1
+                _error_overflow.append(record)
+            else:
+                self.dropped += 1
+
+
+# 所有日志记录器共用一个队列和一个后台日志线程，重新初始化日志系统时只替换输出处理器
+# 队列设上限，后台线程跟不上时丢弃普通记录，避免内存无限增长或阻塞调用方
+_LOG_QUEUE_SIZE = 10000
+_log_queue: queue.Queue = queue.Queue(_LOG_QUEUE_SIZE)
+# 队列满时暂存ERROR及以上级别记录（deque的append/popleft线程安全且不阻塞）
+_error_overflow: deque = deque(maxlen=1000)
+_queue_handler = _NonBlockingQueueHandler(_log_queue)
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.RLock()
+
+
+def _start_listener(handlers: list):
+    """使用新的输出处理器启动后台日志线程（替换已有的线程）"""
+    global _listener
+    with _listener_lock:
+        _stop_listener()
+        _listener = _FlushingQueueListener(
+            _log_queue, *handlers, respect_handler_level=True
+        )
+        _listener.start()
+
+
+def _stop_listener():
+    """停止后台日志线程：先写完队列中已有的记录，再关闭处理器"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _report_dropped(_listener)
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+
+def _report_dropped(listener: logging.handlers.QueueListener):
+    """将队列满时丢弃的记录数作为一条警告写入输出处理器，并重新计数"""
+    dropped, _queue_handler.dropped = _queue_handler.dropped, 0
+    if dropped:
+        listener.handle(logging.makeLogRecord({
+            'name': __name__,
+            'levelno': logging.WARNING,
+            'levelname': 'WARNING',
+            'msg': "⚠️ 日志队列已满，丢弃了 %d 条日志记录",
+            'args': (dropped,),
+        }))
+
+
+atexit.register(_stop_listener)
+
+
+# log_exception输出的堆栈最多保留的帧数
+_TRACEBACK_LIMIT = 20
 
 
 class LoggerManager:
@@ -176,11 +367,13 @@ class LoggerManager:
             'file': 'logs/app.log',
             'max_size': '10MB',
             'backup_count': 5,
+            'buffer_size': '64KB',  # 日志文件写缓冲大小，普通记录攒满或队列清空时才写盘
             'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             'console_format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             'enable_console': True,
             'enable_file': True,
-            'enable_colors': True
+            'enable_colors': True,
+            'max_translation_errors': 1000  # 每个翻译任务保留的最近错误条数
         }
 
         # 合并配置
@@ -188,77 +381,125 @@ class LoggerManager:
             if key not in self.config:
                 self.config[key] = value
 
-    def _parse_size(self, size_str: str) -> int:
-        """解析文件大小字符串"""
-        size_str = size_str.upper().strip()
-
-        # 支持多种格式：10MB, 10M, 10KB, 10K, 10GB, 10G, 10B, 10
-        multipliers = {
-            'GB': 1024**3, 'G': 1024**3,
-            'MB': 1024**2, 'M': 1024**2,
-            'KB': 1024, 'K': 1024,
-            'B': 1
-        }
+        # 级别名只在配置和set_level时解析一次，创建日志记录器时直接使用整数级别
+        self._level = self._resolve_level(self.config['level'])
 
-        for suffix, multiplier in multipliers.items():
-            if size_str.endswith(suffix):
-                number_part = size_str[:-len(suffix)].strip()
-                try:
-                    return int(number_part) * multiplier
-                except ValueError:
-                    return int(float(number_part)) * multiplier
+        # 输出不是终端（重定向到文件、CI等）或设置了NO_COLOR时不输出颜色控制符
+        self._color_supported = (
+            sys.stdout is not None and sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+        )
 
-        # 如果没有单位，默认为字节
-        try:
-            return int(size_str)
-        except ValueError:
+        # 日志记录器只挂共享的QueueHandler，文件和控制台输出由后台日志线程完成
+        handlers = self._create_handlers()
+        self._has_handlers = bool(handlers)
+        _start_listener(handlers)
+        self._configure_root_logger()
+
+    def _configure_root_logger(self):
+        """配置根日志记录器
+
+        直接使用 logging.getLogger(__name__) 的模块（如视频处理、字幕提取）经传播到达根记录器，
+        根记录器挂上共享的QueueHandler后，这些日志与其他日志一样写入文件、控制台和GUI日志面板
+        """
+        root_logger = logging.getLogger()
+        root_logger.setLevel(self._level)
+        if self._has_handlers:
+            if _queue_handler not in root_logger.handlers:
+                root_logger.addHandler(_queue_handler)
+        else:
+            root_logger.removeHandler(_queue_handler)
+
+    @staticmethod
+    def _resolve_level(level: str) -> int:
+        """将级别名（如 'info'）解析为logging的整数级别"""
+        log_level = logging.getLevelName(level.upper())
+        if not isinstance(log_level, int):
+            raise ValueError(f"未知的日志级别: {level}")
+        return log_level
+
+    def _parse_size(self, size_str: str) -> int:
+        """解析文件大小字符串"""
+        # 支持多种格式：10MB, 10M, 10KB, 10K, 10GB, 10G, 10B, 10, 1.5GB
+        # YAML中直接写数字时已是整数
+        if isinstance(size_str, int):
+            return size_str
+        match = _SIZE_RE.match(size_str)
+        if not match:
             return int(float(size_str))
+        number, multiplier = match.group(1), _SIZE_MULTIPLIERS[(match.group(2) or '').upper()]
+        # 常见的整数写法（如10MB）不经过float转换
+        if number.isdigit():
+            return int(number) * multiplier
+        return int(float(number) * multiplier)
 
     def get_logger(self, name: str) -> logging.Logger:
         """获取或创建日志记录器"""
-        if name not in self.loggers:
-            self._create_logger(name)
-        return self.loggers[name]
+        logger = self.loggers.get(name)
+        if logger is None:
+            logger = self._create_logger(name)
+            self.loggers[name] = logger
+        return logger
 
-    def _create_logger(self, name: str):
+    def _create_logger(self, name: str) -> logging.Logger:
         """创建日志记录器"""
         logger = logging.getLogger(name)
-        logger.setLevel(getattr(logging, self.config['level'].upper()))
-
-        # 避免重复添加处理器
-        if logger.handlers:
-            return
+        logger.setLevel(self._level)
+
+        # 自身或上级记录器已挂共享处理器时不再添加，否则日志经传播会重复输出
+        if self._has_handlers and not self._has_queue_handler(logger):
+            logger.addHandler(_queue_handler)
+
+        return logger
+
+    @staticmethod
+    def _has_queue_handler(logger: logging.Logger) -> bool:
+        """检查记录器及其传播链上是否已挂共享的QueueHandler"""
+        current = logger
+        while current is not None:
+            if _queue_handler in current.handlers:
+                return True
+            if not current.propagate:
+                break
+            current = current.parent
+        return False
+
+    def _create_handlers(self) -> list:
+        """创建文件和控制台处理器（所有日志记录器共用）"""
+        handlers = []
 
         # 文件处理器
         if self.config.get('enable_file', True):
             log_file = Path(self.config['file'])
-            log_file.parent.mkdir(parents=True, exist_ok=True)
+            # 日志目录通常已由setup_environment创建，只在缺失时（如CLI或自定义路径）才创建
+            if not log_file.parent.is_dir():
+                log_file.parent.mkdir(parents=True, exist_ok=True)
 
             max_bytes = self._parse_size(self.config['max_size'])
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = BufferedRotatingFileHandler(
                 log_file,
                 maxBytes=max_bytes,
                 backupCount=self.config['backup_count'],
-                encoding='utf-8'
+                encoding='utf-8',
+                buffer_size=self._parse_size(self.config['buffer_size'])
             )
 
             file_formatter = logging.Formatter(self.config['format'])
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
 
         # 控制台处理器
         if self.config.get('enable_console', True):
             console_handler = logging.StreamHandler(sys.stdout)
 
-            if self.config.get('enable_colors', True):
+            if self.config.get('enable_colors', True) and self._color_supported:
                 console_formatter = ColoredFormatter(self.config['console_format'])
             else:
                 console_formatter = logging.Formatter(self.config['console_format'])
 
             console_handler.setFormatter(console_formatter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
 
-        self.loggers[name] = logger
+        return handlers
 
     def get_performance_logger(self, name: str) -> PerformanceLogger:
         """获取性能日志记录器"""
@@ -271,22 +512,28 @@ class LoggerManager:
         """获取翻译日志记录器"""
         if name not in self.translation_loggers:
             logger = self.get_logger(f"{name}.translation")
-            self.translation_loggers[name] = TranslationLogger(logger)
+            self.translation_loggers[name] = TranslationLogger(
+                logger, self.config['max_translation_errors']
+            )
         return self.translation_loggers[name]
 
     def set_level(self, level: str):
         """设置所有日志记录器的级别"""
-        log_level = getattr(logging, level.upper())
+        self._level = self._resolve_level(level)
+        self.config['level'] = level
+        logging.getLogger().setLevel(self._level)
         for logger in self.loggers.values():
-            logger.setLevel(log_level)
+            logger.setLevel(self._level)
 
     def log_exception(self, logger_name: str, exception: Exception, context: str = ""):
         """记录异常信息"""
         logger = self.get_logger(logger_name)
 
-        error_msg = f"异常发生 {context}: {str(exception)}"
-        logger.error(error_msg)
-        logger.debug(f"异常详情:\n{traceback.format_exc()}")
+        logger.error("异常发生 %s: %s", context, exception)
+        # 格式化堆栈开销较大，只在DEBUG级别启用时才生成
+        if logger.isEnabledFor(logging.DEBUG):
+            details = traceback.TracebackException.from_exception(exception, limit=_TRACEBACK_LIMIT)
+            logger.debug("异常详情:\n%s", ''.join(details.format()))
 
     def create_child_logger(self, parent_name: str, child_name: str) -> logging.Logger:
         """创建子日志记录器"""
@@ -327,24 +574,29 @@ def get_translation_logger(name: str) -> TranslationLogger:
 
 
 def log_function_call(logger_name: str = None):
-    """装饰器：记录函数调用"""
+    """装饰器：记录函数调用（DEBUG级别未启用时只记录失败）"""
     def decorator(func):
+        name = logger_name or func.__module__
+        func_name = f"{func.__module__}.{func.__name__}"
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            name = logger_name or func.__module__
             logger = get_logger(name)
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-            func_name = f"{func.__module__}.{func.__name__}"
-            logger.debug(f"🔄 调用函数: {func_name}")
+            if debug_enabled:
+                logger.debug("🔄 调用函数: %s", func_name)
 
             try:
                 result = func(*args, **kwargs)
-                logger.debug(f"✅ 函数执行成功: {func_name}")
-                return result
             except Exception as e:
-                logger.error(f"❌ 函数执行失败: {func_name} - {str(e)}")
+                logger.error("❌ 函数执行失败: %s - %s", func_name, e)
                 raise
 
+            if debug_enabled:
+                logger.debug("✅ 函数执行成功: %s", func_name)
+            return result
+
         return wrapper
     return decorator
 
@@ -4,8 +4,11 @@ API修复验证测试脚本
 Test script to verify the API fix for TranslationResult token_count issue
 """
 
+import os
 import sys
 import asyncio
+import logging
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 import json
@@ -24,12 +27,40 @@ from src.core.translator import (
 )
 from src.utils.config import get_config
 
+# 非交互运行（设置TEST_QUIET或传入--quiet）时只输出失败信息，结果以退出码为准
+QUIET = bool(os.environ.get('TEST_QUIET')) or '--quiet' in sys.argv
+
+
+def log(*args, **kwargs):
+    """输出测试过程信息（安静模式下跳过）"""
+    if not QUIET:
+        print(*args, **kwargs)
+
+
+def create_translator(translator_cls, provider, api_key):
+    """在模拟配置下创建翻译器"""
+    with patch('src.core.translator.get_config', return_value=get_config()):
+        return translator_cls(provider=provider, api_key=api_key)
+
+
+@contextmanager
+def mock_openai_client(response=None, error=None):
+    """模拟 openai.OpenAI().chat.completions.create，返回指定响应或抛出指定异常"""
+    with patch('openai.OpenAI') as mock_openai:
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        if error is not None:
+            mock_client.chat.completions.create.side_effect = error
+        else:
+            mock_client.chat.completions.create.return_value = response
+        yield mock_client
+
 
 def test_translation_result_creation():
     """测试 TranslationResult 对象创建"""
-    print("=" * 60)
-    print("测试 TranslationResult 对象创建")
-    print("=" * 60)
+    log("=" * 60)
+    log("测试 TranslationResult 对象创建")
+    log("=" * 60)
 
     try:
         # 测试基本创建
@@ -39,7 +70,7 @@ def test_translation_result_creation():
             source_language="en",
             target_language="zh-CN"
         )
-        print("✅ 基本 TranslationResult 创建成功")
+        log("✅ 基本 TranslationResult 创建成功")
 
         # 测试带 token_usage 的创建
         result2 = TranslationResult(
@@ -49,8 +80,8 @@ def test_translation_result_creation():
             target_language="zh-CN",
             token_usage={'total_tokens': 10, 'prompt_tokens': 5, 'completion_tokens': 5}
         )
-        print("✅ 带 token_usage 的 TranslationResult 创建成功")
-        print(f"   Token usage: {result2.token_usage}")
+        log("✅ 带 token_usage 的 TranslationResult 创建成功")
+        log(f"   Token usage: {result2.token_usage}")
 
         # 测试所有参数的创建
         result3 = TranslationResult(
@@ -65,11 +96,11 @@ def test_translation_result_creation():
             token_usage={'total_tokens': 15},
             error=None
         )
-        print("✅ 完整参数 TranslationResult 创建成功")
-        print(f"   提供商: {result3.provider}")
-        print(f"   模型: {result3.model}")
-        print(f"   处理时间: {result3.processing_time}s")
-        print(f"   Token usage: {result3.token_usage}")
+        log("✅ 完整参数 TranslationResult 创建成功")
+        log(f"   提供商: {result3.provider}")
+        log(f"   模型: {result3.model}")
+        log(f"   处理时间: {result3.processing_time}s")
+        log(f"   Token usage: {result3.token_usage}")
 
         return True
 
@@ -77,14 +108,14 @@ def test_translation_result_creation():
         print(f"❌ TranslationResult 创建失败: {e}")
         return False
 
-    print()
+    log()
 
 
 def test_translation_result_old_params():
     """测试使用旧参数 token_count 应该失败"""
-    print("=" * 60)
-    print("测试旧参数 token_count (应该失败)")
-    print("=" * 60)
+    log("=" * 60)
+    log("测试旧参数 token_count (应该失败)")
+    log("=" * 60)
 
     try:
         # 这应该失败，因为 token_count 不是有效参数
@@ -100,8 +131,8 @@ def test_translation_result_old_params():
 
     except TypeError as e:
         if "token_count" in str(e):
-            print("✅ 正确拒绝了 token_count 参数")
-            print(f"   错误信息: {e}")
+            log("✅ 正确拒绝了 token_count 参数")
+            log(f"   错误信息: {e}")
             return True
         else:
             print(f"❌ 意外的错误类型: {e}")
@@ -111,14 +142,14 @@ def test_translation_result_old_params():
         print(f"❌ 意外的异常: {e}")
         return False
 
-    print()
+    log()
 
 
 async def test_deepseek_translator():
     """测试 DeepSeek 翻译器的 token_usage 处理"""
-    print("=" * 60)
-    print("测试 DeepSeek 翻译器")
-    print("=" * 60)
+    log("=" * 60)
+    log("测试 DeepSeek 翻译器")
+    log("=" * 60)
 
     try:
         # 创建模拟的 API 响应
@@ -130,13 +161,7 @@ async def test_deepseek_translator():
         mock_response.usage.prompt_tokens = 8
         mock_response.usage.completion_tokens = 7
 
-        # 创建模拟的配置
-        with patch('src.core.translator.get_config', return_value=get_config()):
-            # 创建翻译器
-            translator = DeepSeekTranslator(
-                provider=TranslationProvider.DEEPSEEK,
-                api_key="test-key"
-            )
+        translator = create_translator(DeepSeekTranslator, TranslationProvider.DEEPSEEK, "test-key")
 
         # 创建翻译请求
         request = TranslationRequest(
@@ -146,10 +171,7 @@ async def test_deepseek_translator():
         )
 
         # 模拟 openai.OpenAI().chat.completions.create
-        with patch('openai.OpenAI') as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
-            mock_client.chat.completions.create.return_value = mock_response
+        with mock_openai_client(response=mock_response):
 
             # 执行翻译
             result = await translator.translate(request)
@@ -161,11 +183,11 @@ async def test_deepseek_translator():
             assert result.token_usage is not None
             assert result.token_usage.get('total_tokens') == 15
 
-            print("✅ DeepSeek 翻译器测试成功")
-            print(f"   原文: {result.original_text}")
-            print(f"   译文: {result.translated_text}")
-            print(f"   提供商: {result.provider}")
-            print(f"   Token usage: {result.token_usage}")
+            log("✅ DeepSeek 翻译器测试成功")
+            log(f"   原文: {result.original_text}")
+            log(f"   译文: {result.translated_text}")
+            log(f"   提供商: {result.provider}")
+            log(f"   Token usage: {result.token_usage}")
 
             return True
 
@@ -175,14 +197,14 @@ async def test_deepseek_translator():
         traceback.print_exc()
         return False
 
-    print()
+    log()
 
 
 async def test_ollama_translator():
     """测试 Ollama 翻译器的 token_usage 处理"""
-    print("=" * 60)
-    print("测试 Ollama 翻译器")
-    print("=" * 60)
+    log("=" * 60)
+    log("测试 Ollama 翻译器")
+    log("=" * 60)
 
     try:
         # 创建模拟的 API 响应
@@ -192,13 +214,7 @@ async def test_ollama_translator():
         mock_response.usage = Mock()
         mock_response.usage.total_tokens = 12
 
-        # 创建模拟的配置
-        with patch('src.core.translator.get_config', return_value=get_config()):
-            # 创建翻译器
-            translator = OllamaTranslator(
-                provider=TranslationProvider.OLLAMA,
-                api_key="not-needed"
-            )
+        translator = create_translator(OllamaTranslator, TranslationProvider.OLLAMA, "not-needed")
 
         # 创建翻译请求
         request = TranslationRequest(
@@ -208,10 +224,7 @@ async def test_ollama_translator():
         )
 
         # 模拟 openai.OpenAI().chat.completions.create
-        with patch('openai.OpenAI') as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
-            mock_client.chat.completions.create.return_value = mock_response
+        with mock_openai_client(response=mock_response):
 
             # 执行翻译
             result = await translator.translate(request)
@@ -223,11 +236,11 @@ async def test_ollama_translator():
             assert result.token_usage is not None
             assert result.token_usage.get('total_tokens') == 12
 
-            print("✅ Ollama 翻译器测试成功")
-            print(f"   原文: {result.original_text}")
-            print(f"   译文: {result.translated_text}")
-            print(f"   提供商: {result.provider}")
-            print(f"   Token usage: {result.token_usage}")
+            log("✅ Ollama 翻译器测试成功")
+            log(f"   原文: {result.original_text}")
+            log(f"   译文: {result.translated_text}")
+            log(f"   提供商: {result.provider}")
+            log(f"   Token usage: {result.token_usage}")
 
             return True
 
@@ -237,23 +250,17 @@ async def test_ollama_translator():
         traceback.print_exc()
         return False
 
-    print()
+    log()
 
 
 async def test_error_handling():
     """测试错误处理情况下的 TranslationResult 创建"""
-    print("=" * 60)
-    print("测试错误处理")
-    print("=" * 60)
+    log("=" * 60)
+    log("测试错误处理")
+    log("=" * 60)
 
     try:
-        # 创建模拟的配置
-        with patch('src.core.translator.get_config', return_value=get_config()):
-            # 创建翻译器
-            translator = DeepSeekTranslator(
-                provider=TranslationProvider.DEEPSEEK,
-                api_key="test-key"
-            )
+        translator = create_translator(DeepSeekTranslator, TranslationProvider.DEEPSEEK, "test-key")
 
         # 创建翻译请求
         request = TranslationRequest(
@@ -263,10 +270,7 @@ async def test_error_handling():
         )
 
         # 模拟 API 错误
-        with patch('openai.OpenAI') as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
-            mock_client.chat.completions.create.side_effect = Exception("API Error")
+        with mock_openai_client(error=Exception("API Error")):
 
             # 执行翻译（应该返回错误结果）
             result = await translator.translate(request)
@@ -277,11 +281,11 @@ async def test_error_handling():
             assert "API Error" in result.error  # 检查错误信息是否包含API Error
             assert result.provider == "deepseek"
 
-            print("✅ 错误处理测试成功")
-            print(f"   原文: {result.original_text}")
-            print(f"   译文: {result.translated_text}")
-            print(f"   错误: {result.error}")
-            print(f"   提供商: {result.provider}")
+            log("✅ 错误处理测试成功")
+            log(f"   原文: {result.original_text}")
+            log(f"   译文: {result.translated_text}")
+            log(f"   错误: {result.error}")
+            log(f"   提供商: {result.provider}")
 
             return True
 
@@ -291,14 +295,14 @@ async def test_error_handling():
         traceback.print_exc()
         return False
 
-    print()
+    log()
 
 
 def test_token_usage_access():
     """测试 token_usage 的各种访问方式"""
-    print("=" * 60)
-    print("测试 token_usage 访问方式")
-    print("=" * 60)
+    log("=" * 60)
+    log("测试 token_usage 访问方式")
+    log("=" * 60)
 
     try:
         # 创建带有详细 token 信息的结果
@@ -321,14 +325,14 @@ def test_token_usage_access():
         prompt_tokens = result.token_usage.get('prompt_tokens', 0)
         completion_tokens = result.token_usage.get('completion_tokens', 0)
 
-        print("✅ Token usage 访问测试成功")
-        print(f"   总 tokens: {total_tokens}")
-        print(f"   输入 tokens: {prompt_tokens}")
-        print(f"   输出 tokens: {completion_tokens}")
+        log("✅ Token usage 访问测试成功")
+        log(f"   总 tokens: {total_tokens}")
+        log(f"   输入 tokens: {prompt_tokens}")
+        log(f"   输出 tokens: {completion_tokens}")
 
         # 测试兼容性：检查是否有 total_tokens
         if result.token_usage and result.token_usage.get('total_tokens'):
-            print(f"   ✅ 兼容性检查通过: total_tokens = {result.token_usage.get('total_tokens')}")
+            log(f"   ✅ 兼容性检查通过: total_tokens = {result.token_usage.get('total_tokens')}")
 
         # 测试空值处理
         empty_result = TranslationResult(
@@ -339,7 +343,7 @@ def test_token_usage_access():
         )
 
         safe_tokens = empty_result.token_usage.get('total_tokens', 0) if empty_result.token_usage else 0
-        print(f"   ✅ 空值处理: {safe_tokens}")
+        log(f"   ✅ 空值处理: {safe_tokens}")
 
         return True
 
@@ -347,14 +351,14 @@ def test_token_usage_access():
         print(f"❌ Token usage 访问测试失败: {e}")
         return False
 
-    print()
+    log()
 
 
 async def main():
     """主测试函数"""
-    print("🧪 API修复验证测试开始")
-    print("目标：验证 TranslationResult token_count -> token_usage 修复")
-    print()
+    log("🧪 API修复验证测试开始")
+    log("目标：验证 TranslationResult token_count -> token_usage 修复")
+    log()
 
     tests = [
         ("TranslationResult 基本创建", test_translation_result_creation()),
@@ -371,18 +375,18 @@ async def main():
     for test_name, result in tests:
         if result:
             passed += 1
-            print(f"✅ {test_name}: 通过")
+            log(f"✅ {test_name}: 通过")
         else:
             print(f"❌ {test_name}: 失败")
 
-    print("\n" + "=" * 60)
-    print("测试结果汇总")
-    print("=" * 60)
-    print(f"通过: {passed}/{total}")
-    print(f"失败: {total - passed}/{total}")
+    log("\n" + "=" * 60)
+    log("测试结果汇总")
+    log("=" * 60)
+    log(f"通过: {passed}/{total}")
+    log(f"失败: {total - passed}/{total}")
 
     if passed == total:
-        print("🎉 所有测试通过！API修复成功！")
+        log("🎉 所有测试通过！API修复成功！")
         return 0
     else:
         print("❌ 部分测试失败，需要进一步检查")
@@ -390,6 +394,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
+    if QUIET:
+        # 错误处理测试会故意触发翻译器的错误日志，安静模式下一并关闭
+        logging.disable(logging.CRITICAL)
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
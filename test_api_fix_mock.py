@@ -5,9 +5,14 @@ Test script to verify the API fix for TranslationResult token_count issue using
 """
 
 import sys
+import atexit
 import asyncio
+import inspect
+import functools
+import traceback
+import contextlib
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
 import json
 
 # 添加项目根目录到路径
@@ -21,6 +26,36 @@ from src.core.translator import (
     OllamaTranslator,
     TranslationProvider
 )
+import src.core.translator as translator_mod
+
+# TranslationResult 的参数表，用于检查已移除的参数（不必真正构造对象触发 TypeError）
+_TR_SIGNATURE = inspect.signature(TranslationResult)
+_TR_PARAMS = frozenset(_TR_SIGNATURE.parameters)
+_TR_ACCEPTS_ANY_KWARG = any(
+    param.kind is inspect.Parameter.VAR_KEYWORD for param in _TR_SIGNATURE.parameters.values()
+)
+
+# 所有翻译器测试使用同一个翻译请求（translate 不会修改请求）
+_REQUEST = TranslationRequest(
+    text="Hello world",
+    source_language="en",
+    target_language="zh-CN"
+)
+
+# 所有翻译器测试共用一个事件循环，避免每次 asyncio.run 都新建和关闭事件循环
+_LOOP = asyncio.new_event_loop()
+atexit.register(_LOOP.close)
+
+
+@contextlib.contextmanager
+def swap(obj, attr, new):
+    """临时替换对象属性，退出时恢复（比 unittest.mock.patch 开销小）"""
+    old = getattr(obj, attr)
+    setattr(obj, attr, new)
+    try:
+        yield new
+    finally:
+        setattr(obj, attr, old)
 
 
 def test_translation_result_creation():
@@ -82,6 +117,17 @@ def test_translation_result_old_params():
     print("测试旧参数 token_count (应该失败)")
     print("=" * 60)
 
+    if 'token_count' in _TR_PARAMS:
+        print("❌ TranslationResult 仍然声明了 token_count 参数")
+        return False
+
+    if not _TR_ACCEPTS_ANY_KWARG:
+        # 没有 **kwargs，签名中不存在的参数一定会被拒绝
+        print("✅ 正确拒绝了 token_count 参数")
+        print("   TranslationResult 的参数中没有 token_count")
+        return True
+
+    # 接受任意关键字参数时只能实际构造来验证
     try:
         # 这应该失败，因为 token_count 不是有效参数
         result = TranslationResult(
@@ -164,27 +210,29 @@ def test_token_usage_access():
 
 class MockConfig:
     """模拟配置类"""
+    _DEFAULTS = {
+        'translation.max_tokens': 2000,
+        'translation.temperature': 0.3,
+        'translation.timeout': 30,
+        'api.deepseek.models': ['deepseek-chat'],
+        'api.ollama.models': ['llama2'],
+        'translation.model': 'deepseek-chat'
+    }
+    _LANGUAGES = {
+        'zh-CN': '简体中文',
+        'en': 'English',
+        'ja': '日本語',
+        'ko': '한국어',
+        'fr': 'Français',
+        'de': 'Deutsch'
+    }
+
     def get(self, key, default=None):
-        defaults = {
-            'translation.max_tokens': 2000,
-            'translation.temperature': 0.3,
-            'translation.timeout': 30,
-            'api.deepseek.models': ['deepseek-chat'],
-            'api.ollama.models': ['llama2'],
-            'translation.model': 'deepseek-chat'
-        }
-        return defaults.get(key, default)
+        return self._DEFAULTS.get(key, default)
 
     def get_supported_languages(self):
         """模拟获取支持的语言列表"""
-        return {
-            'zh-CN': '简体中文',
-            'en': 'English',
-            'ja': '日本語',
-            'ko': '한국어',
-            'fr': 'Français',
-            'de': 'Deutsch'
-        }
+        return self._LANGUAGES
 
     def get_api_key(self, provider):
         """模拟获取API密钥"""
@@ -195,16 +243,26 @@ class MockConfig:
         return True
 
 
+# 模拟配置是只读的，所有测试共用一个实例
+_MOCK_CONFIG = MockConfig()
+
+
 class MockResponse:
     """模拟API响应类"""
     def __init__(self, text="你好世界", total_tokens=15):
-        self.choices = [Mock()]
-        self.choices[0].message = Mock()
-        self.choices[0].message.content = text
-        self.usage = Mock()
-        self.usage.total_tokens = total_tokens
-        self.usage.prompt_tokens = total_tokens // 2
-        self.usage.completion_tokens = total_tokens - (total_tokens // 2)
+        self.choices = [SimpleNamespace(message=SimpleNamespace(content=text))]
+        self.usage = SimpleNamespace(
+            total_tokens=total_tokens,
+            prompt_tokens=total_tokens // 2,
+            completion_tokens=total_tokens - (total_tokens // 2)
+        )
+
+
+# 预先构建的模拟响应（原文 -> 响应），翻译器只读取响应，可以在多次调用间复用
+_MOCK_RESPONSES = {
+    "Hello world": MockResponse(text="你好世界", total_tokens=15),
+}
+_DEFAULT_RESPONSE = MockResponse()
 
 
 class MockOpenAI:
@@ -212,135 +270,21 @@ class MockOpenAI:
     def __init__(self, api_key=None, base_url=None):
         self.api_key = api_key
         self.base_url = base_url
-        self.chat = Mock()
-        self.chat.completions = Mock()
-        self.chat.completions.create = self.create_completion
 
-    def create_completion(self, model=None, messages=None, max_tokens=None, temperature=None, timeout=None):
+    @staticmethod
+    def create_completion(model=None, messages=None, max_tokens=None, temperature=None, timeout=None):
         """模拟创建完成请求"""
-        # 提取提示中的文本用于模拟翻译
-        text = ""
-        if messages and len(messages) > 0:
-            text = messages[0].get('content', '')
-
-        # 如果提示中包含 "Hello world"，返回 "你好世界"
-        if "Hello world" in text:
-            return MockResponse(text="你好世界", total_tokens=15)
-        return MockResponse()
+        # 原文在最后一条消息（提示词）中
+        text = messages[-1].get('content', '') if messages else ''
 
+        for source_text, response in _MOCK_RESPONSES.items():
+            if source_text in text:
+                return response
+        return _DEFAULT_RESPONSE
 
-def test_deepseek_translator():
-    """测试 DeepSeek 翻译器的 token_usage 处理"""
-    print("=" * 60)
-    print("测试 DeepSeek 翻译器")
-    print("=" * 60)
-
-    try:
-        # 使用patch模拟配置和OpenAI客户端
-        with patch('src.core.translator.get_config', return_value=MockConfig()):
-            with patch('src.core.translator.openai.OpenAI', new=MockOpenAI):
-                # 创建翻译器
-                translator = DeepSeekTranslator(
-                    provider=TranslationProvider.DEEPSEEK,
-                    api_key="test-key"
-                )
-
-                # 创建翻译请求
-                request = TranslationRequest(
-                    text="Hello world",
-                    source_language="en",
-                    target_language="zh-CN"
-                )
-
-                # 执行翻译
-                result = asyncio.run(translator.translate(request))
-
-                # 验证结果
-                if result.original_text != "Hello world":
-                    raise AssertionError(f"原文不匹配: {result.original_text}")
-
-                if result.translated_text != "你好世界":
-                    raise AssertionError(f"译文不匹配: {result.translated_text}")
-
-                if result.provider != "deepseek":
-                    raise AssertionError(f"提供商不匹配: {result.provider}")
-
-                if not result.token_usage:
-                    raise AssertionError("token_usage为空")
-
-                if result.token_usage.get('total_tokens') != 15:
-                    raise AssertionError(f"total_tokens不匹配: {result.token_usage.get('total_tokens')}")
-
-                print("✅ DeepSeek 翻译器测试成功")
-                print(f"   原文: {result.original_text}")
-                print(f"   译文: {result.translated_text}")
-                print(f"   提供商: {result.provider}")
-                print(f"   Token usage: {result.token_usage}")
 
-        return True
-
-    except Exception as e:
-        print(f"❌ DeepSeek 翻译器测试失败: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-
-def test_ollama_translator():
-    """测试 Ollama 翻译器的 token_usage 处理"""
-    print("=" * 60)
-    print("测试 Ollama 翻译器")
-    print("=" * 60)
-
-    try:
-        # 使用patch模拟配置和OpenAI客户端
-        with patch('src.core.translator.get_config', return_value=MockConfig()):
-            with patch('src.core.translator.openai.OpenAI', new=MockOpenAI):
-                # 创建翻译器
-                translator = OllamaTranslator(
-                    provider=TranslationProvider.OLLAMA,
-                    api_key="not-needed"
-                )
-
-                # 创建翻译请求
-                request = TranslationRequest(
-                    text="Hello world",
-                    source_language="en",
-                    target_language="zh-CN"
-                )
-
-                # 执行翻译
-                result = asyncio.run(translator.translate(request))
-
-                # 验证结果
-                if result.original_text != "Hello world":
-                    raise AssertionError(f"原文不匹配: {result.original_text}")
-
-                if result.translated_text != "你好世界":
-                    raise AssertionError(f"译文不匹配: {result.translated_text}")
-
-                if result.provider != "ollama":
-                    raise AssertionError(f"提供商不匹配: {result.provider}")
-
-                if not result.token_usage:
-                    raise AssertionError("token_usage为空")
-
-                if result.token_usage.get('total_tokens') != 15:
-                    raise AssertionError(f"total_tokens不匹配: {result.token_usage.get('total_tokens')}")
-
-                print("✅ Ollama 翻译器测试成功")
-                print(f"   原文: {result.original_text}")
-                print(f"   译文: {result.translated_text}")
-                print(f"   提供商: {result.provider}")
-                print(f"   Token usage: {result.token_usage}")
-
-        return True
-
-    except Exception as e:
-        print(f"❌ Ollama 翻译器测试失败: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+# chat.completions 不依赖实例状态，在类上只构建一次
+MockOpenAI.chat = SimpleNamespace(completions=SimpleNamespace(create=MockOpenAI.create_completion))
 
 
 class ErrorMockOpenAI:
@@ -348,100 +292,150 @@ class ErrorMockOpenAI:
     def __init__(self, api_key=None, base_url=None):
         self.api_key = api_key
         self.base_url = base_url
-        self.chat = Mock()
-        self.chat.completions = Mock()
-        self.chat.completions.create = self.create_completion
 
-    def create_completion(self, model=None, messages=None, max_tokens=None, temperature=None, timeout=None):
+    @staticmethod
+    def create_completion(model=None, messages=None, max_tokens=None, temperature=None, timeout=None):
         """模拟API错误"""
         # 确保错误信息包含 "API Error"
         raise Exception("API Error: 模拟API调用失败")
 
 
-def test_error_handling():
-    """测试错误处理情况下的 TranslationResult 创建"""
+ErrorMockOpenAI.chat = SimpleNamespace(completions=SimpleNamespace(create=ErrorMockOpenAI.create_completion))
+
+
+def run_translator_case(translator_cls, provider, api_key, client_cls):
+    """在模拟配置和模拟OpenAI客户端下创建翻译器并翻译 "Hello world"，返回翻译结果"""
+    # 临时替换配置和OpenAI客户端
+    with swap(translator_mod, 'get_config', lambda: _MOCK_CONFIG), \
+            swap(translator_mod.openai, 'OpenAI', client_cls):
+        translator = translator_cls(provider=provider, api_key=api_key)
+        return _LOOP.run_until_complete(translator.translate(_REQUEST))
+
+
+def check_translation_success(result, provider_name):
+    """验证成功翻译的结果"""
+    if result.original_text != "Hello world":
+        raise AssertionError(f"原文不匹配: {result.original_text}")
+
+    if result.translated_text != "你好世界":
+        raise AssertionError(f"译文不匹配: {result.translated_text}")
+
+    if result.provider != provider_name:
+        raise AssertionError(f"提供商不匹配: {result.provider}")
+
+    if not result.token_usage:
+        raise AssertionError("token_usage为空")
+
+    if result.token_usage.get('total_tokens') != 15:
+        raise AssertionError(f"total_tokens不匹配: {result.token_usage.get('total_tokens')}")
+
+
+def check_translation_error(result, provider_name):
+    """验证API出错时的结果"""
+    if result.original_text != "Hello world":
+        raise AssertionError(f"原文不匹配: {result.original_text}")
+
+    if result.translated_text != "":
+        raise AssertionError(f"错误时译文应为空: {result.translated_text}")
+
+    if "API Error" not in result.error:
+        raise AssertionError(f"错误信息不包含'API Error': {result.error}")
+
+    if result.provider != provider_name:
+        raise AssertionError(f"提供商不匹配: {result.provider}")
+
+
+# 翻译器测试用例：(测试名称, 翻译器类, 提供商, API密钥, 模拟客户端类, 结果检查函数)
+TRANSLATOR_CASES = {
+    'deepseek': ("DeepSeek 翻译器", DeepSeekTranslator, TranslationProvider.DEEPSEEK, "test-key",
+                 MockOpenAI, check_translation_success),
+    'ollama': ("Ollama 翻译器", OllamaTranslator, TranslationProvider.OLLAMA, "not-needed",
+               MockOpenAI, check_translation_success),
+    'error': ("错误处理", DeepSeekTranslator, TranslationProvider.DEEPSEEK, "test-key",
+              ErrorMockOpenAI, check_translation_error),
+}
+
+
+def run_translator_test(case_key):
+    """运行一个翻译器测试用例，返回是否通过"""
+    title, translator_cls, provider, api_key, client_cls, check = TRANSLATOR_CASES[case_key]
     print("=" * 60)
-    print("测试错误处理")
+    print(f"测试 {title}")
     print("=" * 60)
 
     try:
-        # 使用patch模拟配置和出错的OpenAI客户端
-        with patch('src.core.translator.get_config', return_value=MockConfig()):
-            with patch('src.core.translator.openai.OpenAI', new=ErrorMockOpenAI):
-                # 创建翻译器
-                translator = DeepSeekTranslator(
-                    provider=TranslationProvider.DEEPSEEK,
-                    api_key="test-key"
-                )
-
-                # 创建翻译请求
-                request = TranslationRequest(
-                    text="Hello world",
-                    source_language="en",
-                    target_language="zh-CN"
-                )
-
-                # 执行翻译（应该返回错误结果）
-                result = asyncio.run(translator.translate(request))
-
-                # 验证错误结果
-                if result.original_text != "Hello world":
-                    raise AssertionError(f"原文不匹配: {result.original_text}")
-
-                if result.translated_text != "":
-                    raise AssertionError(f"错误时译文应为空: {result.translated_text}")
-
-                if "API Error" not in result.error:
-                    raise AssertionError(f"错误信息不包含'API Error': {result.error}")
-
-                if result.provider != "deepseek":
-                    raise AssertionError(f"提供商不匹配: {result.provider}")
-
-                print("✅ 错误处理测试成功")
-                print(f"   原文: {result.original_text}")
-                print(f"   译文: {result.translated_text}")
-                print(f"   错误: {result.error}")
-                print(f"   提供商: {result.provider}")
+        result = run_translator_case(translator_cls, provider, api_key, client_cls)
+        check(result, provider.value)
+
+        print(f"✅ {title}测试成功")
+        print(f"   原文: {result.original_text}")
+        print(f"   译文: {result.translated_text}")
+        if result.error:
+            print(f"   错误: {result.error}")
+        print(f"   提供商: {result.provider}")
+        if result.token_usage:
+            print(f"   Token usage: {result.token_usage}")
 
         return True
 
     except Exception as e:
-        print(f"❌ 错误处理测试失败: {e}")
-        import traceback
+        print(f"❌ {title}测试失败: {e}")
         traceback.print_exc()
         return False
 
 
-def main():
-    """主测试函数"""
+def test_deepseek_translator():
+    """测试 DeepSeek 翻译器的 token_usage 处理"""
+    assert run_translator_test('deepseek')
+
+
+def test_ollama_translator():
+    """测试 Ollama 翻译器的 token_usage 处理"""
+    assert run_translator_test('ollama')
+
+
+def test_error_handling():
+    """测试错误处理情况下的 TranslationResult 创建"""
+    assert run_translator_test('error')
+
+
+def main(fail_fast=False):
+    """主测试函数（fail_fast 为 True 时遇到第一个失败的测试即停止）"""
     print("🧪 API修复验证测试开始 (完全模拟版本)")
     print("目标：验证 TranslationResult token_count -> token_usage 修复")
     print()
 
+    # 只保存测试函数，逐个运行，便于提前停止
     tests = [
-        ("TranslationResult 基本创建", test_translation_result_creation()),
-        ("拒绝旧参数 token_count", test_translation_result_old_params()),
-        ("Token usage 访问方式", test_token_usage_access()),
-        ("DeepSeek 翻译器", test_deepseek_translator()),
-        ("Ollama 翻译器", test_ollama_translator()),
-        ("错误处理", test_error_handling()),
+        ("TranslationResult 基本创建", test_translation_result_creation),
+        ("拒绝旧参数 token_count", test_translation_result_old_params),
+        ("Token usage 访问方式", test_token_usage_access),
+        ("DeepSeek 翻译器", functools.partial(run_translator_test, 'deepseek')),
+        ("Ollama 翻译器", functools.partial(run_translator_test, 'ollama')),
+        ("错误处理", functools.partial(run_translator_test, 'error')),
     ]
 
     passed = 0
+    executed = 0
     total = len(tests)
 
-    for test_name, result in tests:
-        if result:
+    for test_name, test_func in tests:
+        executed += 1
+        if test_func():
             passed += 1
             print(f"✅ {test_name}: 通过")
         else:
             print(f"❌ {test_name}: 失败")
+            if fail_fast:
+                break
 
     print("\n" + "=" * 60)
     print("测试结果汇总")
     print("=" * 60)
     print(f"通过: {passed}/{total}")
-    print(f"失败: {total - passed}/{total}")
+    print(f"失败: {executed - passed}/{total}")
+    if executed < total:
+        print(f"跳过: {total - executed}/{total}")
 
     if passed == total:
         print("""
@@ -463,7 +457,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        exit_code = main()
+        exit_code = main(fail_fast='--fail-fast' in sys.argv)
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n\n⏹️ 测试被用户中断")
@@ -85,6 +85,148 @@ class TestConfigSystem(unittest.TestCase):
         retrieved_value = self.config.get('test.value')
         self.assertEqual(retrieved_value, 'test_data')
 
+    def test_config_set_nested_value(self):
+        """测试设置嵌套配置后点分割路径索引保持一致"""
+        self.config.set('test.nested.value', 1, save=False)
+        self.assertEqual(self.config.get('test.nested'), {'value': 1})
+
+        # 覆盖上层键后，旧的下层路径应失效
+        self.config.set('test.nested', 'flat', save=False)
+        self.assertEqual(self.config.get('test.nested'), 'flat')
+        self.assertIsNone(self.config.get('test.nested.value'))
+
+    def test_config_section_mutation_does_not_desync(self):
+        """测试修改get()返回的配置段不会使点分割查询与config_data不一致"""
+        original_level = self.config.get('logging.level')
+        section = self.config.get('logging')
+        section['level'] = 'CHANGED'
+
+        self.assertEqual(self.config.get('logging.level'), original_level)
+        self.assertEqual(self.config.config_data['logging']['level'], original_level)
+        self.assertEqual(self.config.get('logging')['level'], original_level)
+
+    def test_config_set_keeps_index_in_sync(self):
+        """测试get()取出配置段修改后再set()，以及修改传给set()的字典，索引都与config_data一致"""
+        section = self.config.get('logging')
+        section['level'] = 'CHANGED'
+        self.config.set('logging.file', 'logs/other.log', save=False)
+
+        self.assertEqual(self.config.get('logging.file'), 'logs/other.log')
+        self.assertEqual(self.config.get('logging.level'), self.config.config_data['logging']['level'])
+
+        self.config.set('logging', section, save=False)
+        self.assertEqual(self.config.get('logging.level'), 'CHANGED')
+
+        section['level'] = 'CHANGED_AGAIN'
+        self.assertEqual(self.config.get('logging.level'), 'CHANGED')
+        self.assertEqual(self.config.config_data['logging']['level'], 'CHANGED')
+
+    def test_config_save_coalesced(self):
+        """测试连续设置只触发一次配置写入"""
+        from src.utils.config import Config
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = Config(str(Path(tmp_dir) / 'config.yaml'))
+
+            with patch.object(config, 'save_config', wraps=config.save_config) as mock_save:
+                for i in range(5):
+                    config.set('ui.test_value', i)
+                self.assertEqual(mock_save.call_count, 0)
+
+                config._flush()
+                self.assertEqual(mock_save.call_count, 1)
+
+    def test_yaml_cache_invalidated_on_change(self):
+        """测试YAML缓存在文件变化后重新解析"""
+        from src.utils.config import _load_yaml_cached
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yaml_path = Path(tmp_dir) / 'test.yaml'
+            yaml_path.write_text('a: 1\n', encoding='utf-8')
+
+            first = _load_yaml_cached(yaml_path)
+            with self.assertRaises(TypeError):
+                first['a'] = 2
+            self.assertIs(_load_yaml_cached(yaml_path), first)
+
+            yaml_path.write_text('a: 10\n', encoding='utf-8')
+            self.assertEqual(dict(_load_yaml_cached(yaml_path)), {'a': 10})
+
+    def test_yaml_cache_nested_data_read_only(self):
+        """测试YAML缓存的嵌套数据不会被调用方修改"""
+        from src.utils.config import _load_yaml_cached, _thaw
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yaml_path = Path(tmp_dir) / 'api_keys.yaml'
+            yaml_path.write_text(
+                'openai:\n  api_key: key-1\n  models:\n  - gpt-4\n', encoding='utf-8'
+            )
+
+            data = _load_yaml_cached(yaml_path)
+            with self.assertRaises(TypeError):
+                data['openai']['api_key'] = 'changed'
+            with self.assertRaises(AttributeError):
+                data['openai']['models'].append('changed')
+
+            # 复制出的数据可以修改，且不影响缓存
+            copied = _thaw(data)
+            copied['openai']['api_key'] = 'changed'
+            copied['openai']['models'].append('changed')
+
+            reloaded = _load_yaml_cached(yaml_path)
+            self.assertEqual(reloaded['openai']['api_key'], 'key-1')
+            self.assertEqual(list(reloaded['openai']['models']), ['gpt-4'])
+
+    def test_load_env_file(self):
+        """测试.env文件解析"""
+        from src.utils.config import _load_env_file
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            env_path = Path(tmp_dir) / '.env'
+            env_path.write_text(
+                '# 注释\nVT_TEST_PLAIN=value # 行内注释\nexport VT_TEST_QUOTED="a b"\n',
+                encoding='utf-8'
+            )
+
+            with patch.dict(os.environ, {}, clear=False):
+                _load_env_file(env_path)
+                self.assertEqual(os.environ.get('VT_TEST_PLAIN'), 'value')
+                self.assertEqual(os.environ.get('VT_TEST_QUOTED'), 'a b')
+
+    def test_reload_env(self):
+        """测试环境变量快照在reload_env后更新"""
+        with patch.dict(os.environ, {'DEEPSEEK_API_KEY': 'sk-test-before'}):
+            self.config.reload_env()
+            self.assertEqual(self.config._env_snapshot['DEEPSEEK_API_KEY'], 'sk-test-before')
+
+            os.environ['DEEPSEEK_API_KEY'] = 'sk-test-after'
+            self.assertEqual(self.config._env_snapshot['DEEPSEEK_API_KEY'], 'sk-test-before')
+
+            self.config.reload_env()
+            self.assertEqual(self.config._env_snapshot['DEEPSEEK_API_KEY'], 'sk-test-after')
+
+    def test_reload_api_keys(self):
+        """测试reload_api_keys后读取到新写入的API密钥文件"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self.config.api_keys_file = Path(tmp_dir) / 'api_keys.yaml'
+            self.config.reload_api_keys()
+            self.assertEqual(self.config.api_keys_data, {})
+
+            self.config.api_keys_file.write_text('openai:\n  api_key: sk-test-reload\n', encoding='utf-8')
+            self.config.reload_api_keys()
+            self.assertEqual(self.config.get_api_key('openai'), 'sk-test-reload')
+
+    def test_validate_api_config_cached(self):
+        """测试API配置验证结果被缓存，修改api配置后失效"""
+        with patch.object(self.config, '_check_api_config', return_value=False) as mock_check:
+            self.assertFalse(self.config.validate_api_config('openai'))
+            self.assertFalse(self.config.validate_api_config('openai'))
+            self.assertEqual(mock_check.call_count, 1)
+
+            self.config.set('api.openai.timeout', 10, save=False)
+            self.config.validate_api_config('openai')
+            self.assertEqual(mock_check.call_count, 2)
+
     def test_supported_languages(self):
         """测试支持的语言列表"""
         languages = self.config.get_supported_languages()
@@ -98,6 +240,85 @@ class TestConfigSystem(unittest.TestCase):
         self.assertIsInstance(providers, dict)
         self.assertIn('openai', providers)
 
+    def test_translation_providers_follow_api_config(self):
+        """测试修改api配置后提供商信息同步更新"""
+        self.config.get_translation_providers()
+        self.config.set('api.openai.models', ['test-model'], save=False)
+        providers = self.config.get_translation_providers()
+        self.assertEqual(providers['openai']['models'], ['test-model'])
+
+
+class TestLoggerSystem(unittest.TestCase):
+    """测试日志系统"""
+
+    def setUp(self):
+        """测试前准备"""
+        from src.utils import logger as logger_module
+        self.logger_module = logger_module
+        self.previous_manager = logger_module._logger_manager
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = Path(self.temp_dir) / 'app.log'
+
+    def tearDown(self):
+        """测试后清理"""
+        import shutil
+        if self.previous_manager is not None:
+            self.logger_module.init_logger(self.previous_manager.config)
+        else:
+            self.logger_module._stop_listener()
+            self.logger_module._logger_manager = None
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read_log(self) -> str:
+        """停止后台日志线程（写完队列中的记录）后读取日志文件"""
+        self.logger_module._stop_listener()
+        return self.log_file.read_text(encoding='utf-8')
+
+    def test_module_logger_reaches_log_file(self):
+        """测试直接使用 logging.getLogger 的模块日志写入日志文件"""
+        import logging
+        self.logger_module.init_logger({
+            'file': str(self.log_file),
+            'enable_console': False
+        })
+
+        logging.getLogger('src.core.x').info("模块日志测试")
+
+        self.assertIn("src.core.x - INFO - 模块日志测试", self._read_log())
+
+    def test_full_queue_never_blocks(self):
+        """测试队列已满时记录不阻塞调用方：普通记录丢弃计数，ERROR记录进入溢出缓冲区"""
+        import queue
+        import logging
+        handler = self.logger_module._NonBlockingQueueHandler(queue.Queue(1))
+        overflow = self.logger_module._error_overflow
+        overflow.clear()
+
+        def make_record(level, msg):
+            return logging.makeLogRecord({'levelno': level, 'levelname': logging.getLevelName(level), 'msg': msg})
+
+        try:
+            handler.enqueue(make_record(logging.INFO, "第一条"))
+            handler.enqueue(make_record(logging.INFO, "被丢弃"))
+            self.assertEqual(handler.dropped, 1)
+
+            handler.enqueue(make_record(logging.ERROR, "错误"))
+            self.assertEqual(handler.dropped, 1)
+            self.assertEqual([r.msg for r in overflow], ["错误"])
+        finally:
+            overflow.clear()
+
+    def test_helpers_follow_reinitialized_level(self):
+        """测试重新初始化日志系统后便捷函数使用新的日志级别"""
+        config = {'file': str(self.log_file), 'enable_console': False}
+        self.logger_module.init_logger(dict(config, level='INFO'))
+        self.logger_module.info("初始化为INFO")
+
+        self.logger_module.init_logger(dict(config, level='DEBUG'))
+        self.logger_module.debug("重新初始化为DEBUG")
+
+        self.assertIn("main - DEBUG - 重新初始化为DEBUG", self._read_log())
+
 
 class TestHelperFunctions(unittest.TestCase):
     """测试辅助函数"""
@@ -287,6 +508,47 @@ class TestTranslationManager(unittest.TestCase):
         self.assertIn('supported_languages', stats)
 
 
+class TestMainWindow(unittest.TestCase):
+    """测试主窗口逻辑（不创建真实窗口）"""
+
+    def setUp(self):
+        """测试前准备"""
+        try:
+            from src.gui import main_window
+        except ImportError as e:
+            self.skipTest(f"GUI依赖不可用: {e}")
+        self.main_window = main_window
+
+    def _make_gui(self):
+        """创建不带界面的主窗口对象"""
+        gui = self.main_window.VideoTranslatorGUI.__new__(self.main_window.VideoTranslatorGUI)
+        gui.config = Mock()
+        gui.selected_files = []
+        gui._selected_set = set()
+        gui.update_file_list = Mock()
+        gui.update_button_states = Mock()
+        gui.show_status = Mock()
+        return gui
+
+    def test_select_directory_sees_nested_changes(self):
+        """测试重新选择目录时能发现子目录中新增的视频文件"""
+        gui = self._make_gui()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            nested = Path(tmp_dir) / 'season1'
+            nested.mkdir()
+            (nested / 'ep1.mp4').write_bytes(b'')
+
+            with patch.object(self.main_window.filedialog, 'askdirectory', return_value=tmp_dir):
+                gui.select_directory()
+                self.assertEqual([p.name for p in gui.selected_files], ['ep1.mp4'])
+
+                (nested / 'ep2.mp4').write_bytes(b'')
+                gui.select_directory()
+
+            self.assertEqual(sorted(p.name for p in gui.selected_files), ['ep1.mp4', 'ep2.mp4'])
+
+
 class TestIntegration(unittest.TestCase):
     """集成测试"""
 
@@ -339,11 +601,13 @@ def run_tests():
     test_classes = [
         TestBasicImports,
         TestConfigSystem,
+        TestLoggerSystem,
         TestHelperFunctions,
         TestSubtitleExtractor,
         TestSubtitleWriter,
         TestVideoProcessor,
         TestTranslationManager,
+        TestMainWindow,
         TestIntegration
     ]
 